@@ -4,10 +4,36 @@ Integrates with LLM (OpenAI/Groq) for natural language interactions
 """
 
 import os
+import logging
 import json
+import asyncio
+import functools
 from typing import Optional, List, Dict, Any, Tuple
-from datetime import datetime
+from datetime import datetime, timezone
 import uuid
+from cachetools import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Conversations idle longer than this are dropped, oldest first when full
+CONVERSATION_TTL = 3600
+MAX_CONVERSATIONS = 10_000
+
+# Output token budget per reasoning (batched calls scale it by item count)
+REASONING_MAX_TOKENS = 150
+
+
+class FallbackReasoning(str):
+    """Template reasoning returned when the LLM is unavailable; not worth caching"""
+
+
+def _fallback_reasoning(
+    artwork_style: str, room_style: Optional[str], match_score: float
+) -> FallbackReasoning:
+    """Template reasoning used when there is no provider or the call fails"""
+    return FallbackReasoning(
+        f"This {artwork_style} piece complements your {room_style or 'room'} with a {match_score:.0f}% match."
+    )
 
 
 class ChatAgent:
@@ -42,9 +68,24 @@ class ChatAgent:
             self.api_key = None
             self.model = None
         
-        # In-memory conversation storage (for development)
-        # In production, use Redis or database
-        self.conversations: Dict[str, List[Dict[str, str]]] = {}
+        # In-memory conversation storage (for development), bounded so it
+        # cannot grow without limit. In production, use Redis or database
+        self.conversations: TTLCache = TTLCache(
+            maxsize=MAX_CONVERSATIONS, ttl=CONVERSATION_TTL
+        )
+
+        # Caps concurrent reasoning requests to the provider; extra ones queue
+        self._reasoning_slots = asyncio.Semaphore(int(os.getenv("CHAT_CONCURRENCY", 6)))
+
+        # generate_reasoning_coalesced(): specs queued within the wait window
+        # (from any request) share generate_reasoning_batch calls of up to
+        # REASONING_BATCH_MAX items (REASONING_BATCH_WAIT_MS=0 disables)
+        self.reasoning_batch_wait = float(os.getenv("REASONING_BATCH_WAIT_MS", 8)) / 1000
+        self.reasoning_batch_max = int(os.getenv("REASONING_BATCH_MAX", 16))
+        self._reasoning_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._reasoning_pending: List[tuple] = []
+        self._reasoning_flush: Optional[asyncio.TimerHandle] = None
+        self._reasoning_tasks: set = set()
         
         # System prompt for décor context
         self.system_prompt = """You are an expert interior design AI assistant for Art.Decor.AI. 
@@ -82,16 +123,16 @@ Guidelines:
         self, conversation_id: str, role: str, content: str
     ) -> None:
         """Add message to conversation history"""
-        if conversation_id not in self.conversations:
-            self.conversations[conversation_id] = []
-        
-        self.conversations[conversation_id].append(
+        history = self.conversations.get(conversation_id, [])
+        history.append(
             {
                 "role": role,
                 "content": content,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": datetime.now(timezone.utc).isoformat(),
             }
         )
+        # Re-inserting restarts the conversation's idle TTL
+        self.conversations[conversation_id] = history
 
     async def chat(
         self,
@@ -134,7 +175,7 @@ Guidelines:
         try:
             response_text = await self._get_llm_response(messages)
         except Exception as e:
-            print(f"LLM error: {e}")
+            logger.warning("LLM error: %s", e)
             # Fallback disabled - raise error to show Gemini is required
             raise Exception(f"Gemini API error: {e}. Please check your GEMINI_API_KEY.")
             # FALLBACK DISABLED: Uncomment below to re-enable fallback responses
@@ -411,7 +452,7 @@ Guidelines:
                 colors = ", ".join(color_list)
                 parts.append(f"- Dominant colors: {colors}")
             except Exception as e:
-                print(f"Error formatting colors: {e}")
+                logger.warning("Error formatting colors: %s", e)
         
         if "lighting" in context:
             lighting = context["lighting"]
@@ -480,34 +521,150 @@ Guidelines:
             artwork_tags: Tags associated with the artwork
         
         Returns:
-            AI-generated reasoning text
+            AI-generated reasoning text, or a FallbackReasoning template if
+            the LLM is unavailable
         """
         if not self.api_key and self.provider != "ollama":
             # Fallback to template if no API key (Ollama doesn't need one)
-            return f"This {artwork_style} piece complements your {room_style or 'room'} with a {match_score:.0f}% match."
+            return _fallback_reasoning(artwork_style, room_style, match_score)
         
         try:
             # Build context for LLM
             color_desc = f" with colors like {', '.join(colors[:2])}" if colors else ""
             prompt = f"""Write 1-2 sentences explaining why the {artwork_style} artwork "{artwork_title}" matches a {room_style or 'modern'} room{color_desc}. Focus on style harmony and aesthetic benefits."""
 
-            if self.provider == "ollama":
-                return await self._ollama_reasoning_request(prompt)
-            elif self.provider == "groq":
-                return await self._groq_reasoning_request(prompt)
-            elif self.provider == "gemini":
-                return await self._gemini_reasoning_request(prompt)
-            elif self.provider == "openai":
-                return await self._openai_reasoning_request(prompt)
-            else:
-                return f"This {artwork_style} piece complements your {room_style or 'room'} with a {match_score:.0f}% match."
+            return await self._reasoning_request(prompt, REASONING_MAX_TOKENS)
                 
         except Exception as e:
-            print(f"Error generating reasoning: {e}")
+            logger.warning("Error generating reasoning: %s", e)
             # Fallback to template
-            return f"This {artwork_style} piece complements your {room_style or 'room'} with a {match_score:.0f}% match."
+            return _fallback_reasoning(artwork_style, room_style, match_score)
+
+    async def generate_reasoning_batch(
+        self, specs: List[Dict[str, Any]]
+    ) -> List[str]:
+        """
+        Generate reasoning for several artworks with a single LLM call
+
+        Args:
+            specs: generate_reasoning() keyword arguments, one dict per artwork
+
+        Returns:
+            One reasoning text per spec, in order. Falls back to concurrent
+            per-item generate_reasoning() calls if the batched reply is unusable.
+        """
+        if len(specs) <= 1 or (not self.api_key and self.provider != "ollama"):
+            return list(await asyncio.gather(
+                *[self.generate_reasoning(**spec) for spec in specs]
+            ))
+
+        try:
+            items = []
+            for number, spec in enumerate(specs, 1):
+                colors = spec.get("colors")
+                color_desc = f" with colors like {', '.join(colors[:2])}" if colors else ""
+                items.append(
+                    f"{number}. The {spec['artwork_style']} artwork \"{spec['artwork_title']}\" "
+                    f"for a {spec.get('room_style') or 'modern'} room{color_desc}"
+                )
+            prompt = (
+                "For each numbered artwork below, write 1-2 sentences explaining why it "
+                "matches the room. Focus on style harmony and aesthetic benefits.\n\n"
+                + "\n".join(items)
+                + f"\n\nRespond with only a JSON array of {len(specs)} strings, one per artwork, in order."
+            )
+
+            text = await self._reasoning_request(
+                prompt, REASONING_MAX_TOKENS * len(specs)
+            )
+            return _parse_reasoning_batch(text, len(specs))
+
+        except Exception as e:
+            logger.warning("Batch reasoning failed, falling back to per-item calls: %s", e)
+            return list(await asyncio.gather(
+                *[self.generate_reasoning(**spec) for spec in specs]
+            ))
+
+    async def generate_reasoning_coalesced(
+        self, specs: List[Dict[str, Any]]
+    ) -> List[str]:
+        """
+        generate_reasoning_batch() shared with concurrent callers
+
+        Specs queued within REASONING_BATCH_WAIT_MS (or until
+        REASONING_BATCH_MAX are waiting) are answered together, so
+        simultaneous requests cost one LLM round-trip instead of one each.
+        """
+        if self.reasoning_batch_wait <= 0 or not specs:
+            return await self.generate_reasoning_batch(specs)
+
+        loop = asyncio.get_running_loop()
+        if self._reasoning_loop is not loop:
+            # First use, or the previous event loop is gone (e.g. scripts)
+            self._reasoning_loop = loop
+            self._reasoning_pending = []
+            self._reasoning_flush = None
+
+        futures = []
+        for spec in specs:
+            future = loop.create_future()
+            self._reasoning_pending.append((spec, future))
+            futures.append(future)
+        if len(self._reasoning_pending) >= self.reasoning_batch_max:
+            self._flush_reasoning()
+        elif self._reasoning_flush is None:
+            self._reasoning_flush = loop.call_later(
+                self.reasoning_batch_wait, self._flush_reasoning
+            )
+        return list(await asyncio.gather(*futures))
+
+    def _flush_reasoning(self):
+        """Start batched reasoning calls for all queued specs"""
+        if self._reasoning_flush is not None:
+            self._reasoning_flush.cancel()
+            self._reasoning_flush = None
+        pending, self._reasoning_pending = self._reasoning_pending, []
+        for start in range(0, len(pending), self.reasoning_batch_max):
+            task = asyncio.ensure_future(
+                self._reason_pending(pending[start:start + self.reasoning_batch_max])
+            )
+            self._reasoning_tasks.add(task)
+            task.add_done_callback(self._reasoning_tasks.discard)
+
+    async def _reason_pending(self, batch: List[tuple]):
+        """Run one batched reasoning call for (spec, future) pairs and resolve them"""
+        try:
+            texts = await self.generate_reasoning_batch([spec for spec, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), text in zip(batch, texts):
+            if not future.done():  # The caller may have been cancelled
+                future.set_result(text)
+
+    async def _reasoning_request(self, prompt: str, max_tokens: int) -> str:
+        """Send a reasoning prompt to the configured provider"""
+        async with self._reasoning_slots:
+            return await self._dispatch_reasoning_request(prompt, max_tokens)
+
+    async def _dispatch_reasoning_request(self, prompt: str, max_tokens: int) -> str:
+        """Route a reasoning prompt to the provider-specific request"""
+        if self.provider == "ollama":
+            return await self._ollama_reasoning_request(prompt, max_tokens)
+        elif self.provider == "groq":
+            return await self._groq_reasoning_request(prompt, max_tokens)
+        elif self.provider == "gemini":
+            return await self._gemini_reasoning_request(prompt, max_tokens)
+        elif self.provider == "openai":
+            return await self._openai_reasoning_request(prompt, max_tokens)
+        raise Exception(f"No reasoning provider configured ({self.provider})")
     
-    async def _ollama_reasoning_request(self, prompt: str) -> str:
+    async def _ollama_reasoning_request(
+        self, prompt: str, max_tokens: int = REASONING_MAX_TOKENS
+    ) -> str:
         """Generate reasoning using Ollama (LLaVA/Llama Vision)"""
         try:
             import httpx
@@ -520,7 +677,7 @@ Guidelines:
                 "stream": False,
                 "options": {
                     "temperature": 0.7,
-                    "num_predict": 150,
+                    "num_predict": max_tokens,
                 }
             }
             
@@ -537,7 +694,9 @@ Guidelines:
         except Exception as e:
             raise Exception(f"Ollama reasoning error: {e}")
     
-    async def _gemini_reasoning_request(self, prompt: str) -> str:
+    async def _gemini_reasoning_request(
+        self, prompt: str, max_tokens: int = REASONING_MAX_TOKENS
+    ) -> str:
         """Generate reasoning using Gemini"""
         try:
             import google.generativeai as genai
@@ -562,7 +721,7 @@ Guidelines:
                 prompt,
                 generation_config=genai.GenerationConfig(
                     temperature=0.7,
-                    max_output_tokens=150,
+                    max_output_tokens=max_tokens,
                 )
             )
             
@@ -582,10 +741,10 @@ Guidelines:
                 
                 # Log finish reason for debugging
                 finish_reason = candidate.finish_reason if hasattr(candidate, 'finish_reason') else 'unknown'
-                print(f"Gemini finish_reason: {finish_reason}")
+                logger.debug("Gemini finish_reason: %s", finish_reason)
                 
                 if finish_reason == 2:  # SAFETY
-                    print("Safety block - using simplified prompt fallback")
+                    logger.warning("Safety block - using simplified prompt fallback")
                     # Try again with even simpler prompt
                     simple_prompt = f"Describe how {prompt.split('artwork')[1].split('matches')[0] if 'artwork' in prompt else 'this art'} complements the room decor."
                     simple_response = await model.generate_content_async(
@@ -604,7 +763,9 @@ Guidelines:
         except Exception as e:
             raise Exception(f"Gemini reasoning error: {e}")
     
-    async def _openai_reasoning_request(self, prompt: str) -> str:
+    async def _openai_reasoning_request(
+        self, prompt: str, max_tokens: int = REASONING_MAX_TOKENS
+    ) -> str:
         """Generate reasoning using OpenAI"""
         try:
             import openai
@@ -614,14 +775,16 @@ Guidelines:
                 model=self.model,
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.7,
-                max_tokens=150,
+                max_tokens=max_tokens,
             )
             
             return response.choices[0].message.content.strip()
         except Exception as e:
             raise Exception(f"OpenAI reasoning error: {e}")
     
-    async def _groq_reasoning_request(self, prompt: str) -> str:
+    async def _groq_reasoning_request(
+        self, prompt: str, max_tokens: int = REASONING_MAX_TOKENS
+    ) -> str:
         """Generate reasoning using Groq"""
         try:
             from groq import AsyncGroq
@@ -631,7 +794,7 @@ Guidelines:
                 model=self.model,
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.7,
-                max_tokens=150,
+                max_tokens=max_tokens,
             )
             
             return response.choices[0].message.content.strip()
@@ -639,14 +802,28 @@ Guidelines:
             raise Exception(f"Groq reasoning error: {e}")
 
 
-# Singleton instance
-_chat_agent_instance = None
+def _parse_reasoning_batch(text: str, count: int) -> List[str]:
+    """
+    Parse a batched reasoning reply (a JSON array of strings)
+
+    Tolerates markdown code fences or prose around the array; raises
+    ValueError if the reply does not hold exactly count strings.
+    """
+    start, end = text.find("["), text.rfind("]")
+    if start == -1 or end < start:
+        raise ValueError("no JSON array in batched reasoning reply")
+    reasonings = json.loads(text[start:end + 1])
+    if (
+        not isinstance(reasonings, list)
+        or len(reasonings) != count
+        or not all(isinstance(r, str) and r.strip() for r in reasonings)
+    ):
+        raise ValueError(f"expected {count} reasoning strings")
+    return [r.strip() for r in reasonings]
 
 
+@functools.cache
 def get_chat_agent() -> ChatAgent:
-    """Get or create chat agent instance"""
-    global _chat_agent_instance
-    if _chat_agent_instance is None:
-        _chat_agent_instance = ChatAgent()
-    return _chat_agent_instance
+    """Get or create chat agent singleton"""
+    return ChatAgent()
 
@@ -3,6 +3,7 @@ DecisionRouter: Orchestrates all AI agents and forms final recommendations
 Integrates Vision, Trend, and Geo agents to create cohesive responses
 """
 
+import logging
 from typing import Dict, List, Any, Optional
 from PIL import Image
 import numpy as np
@@ -11,6 +12,8 @@ from .vision_match_agent import VisionMatchAgent
 from .trend_intel_agent import TrendIntelAgent
 from .geo_finder_agent import GeoFinderAgent
 
+logger = logging.getLogger(__name__)
+
 
 class DecisionRouter:
     """
@@ -24,7 +27,7 @@ class DecisionRouter:
         self.vision_agent = VisionMatchAgent()
         self.trend_agent = TrendIntelAgent()
         self.geo_agent = GeoFinderAgent()
-        print("DecisionRouter initialized with all agents")
+        logger.info("DecisionRouter initialized with all agents")
 
     async def analyze_and_recommend(
         self,
@@ -4,10 +4,12 @@ Uses Google Maps API for location-based search
 """
 
 import os
+import logging
 from typing import List, Dict, Any, Optional, Tuple
 from dotenv import load_dotenv
 
 load_dotenv()
+logger = logging.getLogger(__name__)
 
 
 class GeoFinderAgent:
@@ -26,12 +28,12 @@ class GeoFinderAgent:
                 import googlemaps
 
                 self.gmaps = googlemaps.Client(key=self.api_key)
-                print("GeoFinderAgent initialized with Google Maps API")
+                logger.info("GeoFinderAgent initialized with Google Maps API")
             except (ImportError, ValueError) as e:
-                print(f"Warning: Could not initialize Google Maps client: {e}. Using mock data.")
+                logger.warning("Could not initialize Google Maps client: %s. Using mock data.", e)
                 self.gmaps = None
         else:
-            print("Warning: GOOGLE_MAPS_API_KEY not set. Using mock data.")
+            logger.warning("GOOGLE_MAPS_API_KEY not set. Using mock data.")
             self.gmaps = None
 
     async def find_nearby_stores(
@@ -59,7 +61,7 @@ class GeoFinderAgent:
                     latitude, longitude, radius, store_type
                 )
             except Exception as e:
-                print(f"Error searching stores: {e}")
+                logger.warning("Error searching stores: %s", e)
                 return self._get_mock_stores(latitude, longitude)
         else:
             return self._get_mock_stores(latitude, longitude)
@@ -105,7 +107,7 @@ class GeoFinderAgent:
 
             return sorted(stores, key=lambda x: x["distance"])
         except Exception as e:
-            print(f"Error in Google Maps API call: {e}")
+            logger.warning("Error in Google Maps API call: %s", e)
             return self._get_mock_stores(lat, lng)
 
     def _get_mock_stores(self, lat: float, lng: float) -> List[Dict[str, Any]]:
@@ -248,7 +250,7 @@ class GeoFinderAgent:
                         ][:5],  # First 5 steps
                     }
             except Exception as e:
-                print(f"Error getting directions: {e}")
+                logger.warning("Error getting directions: %s", e)
 
         # Mock directions
         return {
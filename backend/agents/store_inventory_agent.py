@@ -4,12 +4,15 @@ Integrates with FREE APIs and affiliate programs for purchasable artwork
 """
 
 import os
+import logging
 import asyncio
+import functools
 from typing import List, Dict, Any, Optional
 from dotenv import load_dotenv
 import httpx
 
 load_dotenv()
+logger = logging.getLogger(__name__)
 
 
 class StoreInventoryAgent:
@@ -74,9 +77,9 @@ class StoreInventoryAgent:
             sources.append("Tavily Search (Already configured)")
             
         if sources:
-            print(f"✅ StoreInventoryAgent initialized with FREE sources: {', '.join(sources)}")
+            logger.info("✅ StoreInventoryAgent initialized with FREE sources: %s", ', '.join(sources))
         else:
-            print("⚠️  StoreInventoryAgent: No API keys configured. Using curated mock data with real links.")
+            logger.warning("⚠️  StoreInventoryAgent: No API keys configured. Using curated mock data with real links.")
 
     async def search_artwork(
         self,
@@ -124,7 +127,7 @@ class StoreInventoryAgent:
                 if len(results) >= limit:
                     return results[:limit]
             except Exception as e:
-                print(f"Error searching Unsplash: {e}")
+                logger.warning("Error searching Unsplash: %s", e)
         
         # Priority 2: Tavily (faster than Google Shopping, already configured)
         if self.tavily_api_key and len(results) < limit:
@@ -137,7 +140,7 @@ class StoreInventoryAgent:
                 if len(results) >= limit:
                     return results[:limit]
             except Exception as e:
-                print(f"Error searching Tavily: {e}")
+                logger.warning("Error searching Tavily: %s", e)
         
         # Only try these if we still need more results (rare)
         # Priority 3: Pixabay (FREE, specific art images)
@@ -148,7 +151,7 @@ class StoreInventoryAgent:
                 )
                 results.extend(pixabay_results)
             except Exception as e:
-                print(f"Error searching Pixabay: {e}")
+                logger.warning("Error searching Pixabay: %s", e)
         
         # Priority 4: Pexels (FREE, specific stock photos)
         if self.pexels_api_key and len(results) < limit:
@@ -158,7 +161,7 @@ class StoreInventoryAgent:
                 )
                 results.extend(pexels_results)
             except Exception as e:
-                print(f"Error searching Pexels: {e}")
+                logger.warning("Error searching Pexels: %s", e)
         
         # Priority 5: Google Shopping API (slower, use as last resort)
         if self.google_api_key and len(results) < limit:
@@ -168,7 +171,7 @@ class StoreInventoryAgent:
                 )
                 results.extend(google_results)
             except Exception as e:
-                print(f"Error searching Google Shopping: {e}")
+                logger.warning("Error searching Google Shopping: %s", e)
         
         # Fallback: Curated mock data with real purchasable links
         if not results:
@@ -239,7 +242,7 @@ class StoreInventoryAgent:
             return results
             
         except Exception as e:
-            print(f"Tavily product search error: {e}")
+            logger.warning("Tavily product search error: %s", e)
             return []
 
     async def _search_google_shopping(
@@ -294,7 +297,7 @@ class StoreInventoryAgent:
             return results
             
         except Exception as e:
-            print(f"Google Shopping API error: {e}")
+            logger.warning("Google Shopping API error: %s", e)
             return []
 
     async def _search_pixabay(self, query: str, limit: int) -> List[Dict[str, Any]]:
@@ -349,7 +352,7 @@ class StoreInventoryAgent:
             return results
             
         except Exception as e:
-            print(f"Pixabay API error: {e}")
+            logger.warning("Pixabay API error: %s", e)
             return []
     
     def _extract_store_name(self, url: str) -> str:
@@ -445,7 +448,7 @@ class StoreInventoryAgent:
             return results
             
         except Exception as e:
-            print(f"Unsplash API error: {e}")
+            logger.warning("Unsplash API error: %s", e)
             return []
 
     async def _search_pexels(self, query: str, limit: int) -> List[Dict[str, Any]]:
@@ -495,7 +498,7 @@ class StoreInventoryAgent:
             return results
             
         except Exception as e:
-            print(f"Pexels API error: {e}")
+            logger.warning("Pexels API error: %s", e)
             return []
 
     def _get_mock_artwork_with_real_links(self, query: str, limit: int) -> List[Dict[str, Any]]:
@@ -679,7 +682,7 @@ class StoreInventoryAgent:
             return None
             
         except Exception as e:
-            print(f"Error fetching Pixabay photo: {e}")
+            logger.warning("Error fetching Pixabay photo: %s", e)
             return None
 
     async def _get_unsplash_photo(self, photo_id: str) -> Optional[Dict[str, Any]]:
@@ -701,7 +704,7 @@ class StoreInventoryAgent:
             return data
             
         except Exception as e:
-            print(f"Error fetching Unsplash photo: {e}")
+            logger.warning("Error fetching Unsplash photo: %s", e)
             return None
 
     async def _get_pexels_photo(self, photo_id: str) -> Optional[Dict[str, Any]]:
@@ -723,7 +726,7 @@ class StoreInventoryAgent:
             return data
             
         except Exception as e:
-            print(f"Error fetching Pexels photo: {e}")
+            logger.warning("Error fetching Pexels photo: %s", e)
             return None
 
     async def close(self):
@@ -731,9 +734,8 @@ class StoreInventoryAgent:
         await self.http_client.aclose()
 
 
-def get_store_inventory_agent():
+@functools.cache
+def get_store_inventory_agent() -> StoreInventoryAgent:
     """Get singleton instance of StoreInventoryAgent"""
-    if not hasattr(get_store_inventory_agent, "_instance"):
-        get_store_inventory_agent._instance = StoreInventoryAgent()
-    return get_store_inventory_agent._instance
+    return StoreInventoryAgent()
 
@@ -4,11 +4,13 @@ Uses Tavily API for real-time trend data
 """
 
 import os
+import logging
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from dotenv import load_dotenv
 
 load_dotenv()
+logger = logging.getLogger(__name__)
 
 
 class TrendIntelAgent:
@@ -27,12 +29,12 @@ class TrendIntelAgent:
                 from tavily import TavilyClient
 
                 self.client = TavilyClient(api_key=self.api_key)
-                print("TrendIntelAgent initialized with Tavily API")
+                logger.info("TrendIntelAgent initialized with Tavily API")
             except ImportError:
-                print("Warning: tavily-python not installed. Using mock trends.")
+                logger.warning("tavily-python not installed. Using mock trends.")
                 self.client = None
         else:
-            print("Warning: TAVILY_API_KEY not set. Using mock trends.")
+            logger.warning("TAVILY_API_KEY not set. Using mock trends.")
             self.client = None
 
     async def get_trending_styles(
@@ -51,7 +53,7 @@ class TrendIntelAgent:
             try:
                 return await self._fetch_real_trends(location)
             except Exception as e:
-                print(f"❌ Error fetching trends from Tavily: {e}")
+                logger.warning("❌ Error fetching trends from Tavily: %s", e)
                 raise Exception(f"Tavily API error: {e}. Please check your TAVILY_API_KEY.")
         else:
             raise Exception("TAVILY_API_KEY not configured. Please set it in .env file.")
@@ -107,7 +109,7 @@ class TrendIntelAgent:
             
             return trends
         except Exception as e:
-            print(f"❌ Error in Tavily API call: {e}")
+            logger.warning("❌ Error in Tavily API call: %s", e)
             raise Exception(f"Tavily API error: {e}")
 
     def _extract_all_styles(self, text: str) -> List[str]:
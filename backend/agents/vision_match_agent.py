@@ -4,16 +4,21 @@ Uses YOLOv8 for wall/furniture detection, k-means for color extraction,
 and CLIP/DINOv2 for style embeddings
 """
 
+import asyncio
 import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional, Tuple
 import numpy as np
 from PIL import Image
 import torch
 from transformers import CLIPProcessor, CLIPModel
 from ultralytics import YOLO
-from sklearn.cluster import KMeans
+import cv2
 from dotenv import load_dotenv
 
+from utils.vectors import encode_style_vector
+
 load_dotenv()
 
 
@@ -31,8 +36,16 @@ class VisionMatchAgent:
     - palette: List of dominant colors with RGB and hex
     - lighting: Detailed lighting characteristics
     - style_vector: 512-dimensional embedding for similarity search
+      (base64-encoded float16, see utils.vectors)
     """
 
+    # Relevant YOLO categories for room analysis ('person' is kept for scale reference)
+    _RELEVANT = frozenset({
+        'couch', 'chair', 'bed', 'dining table', 'potted plant',
+        'tv', 'laptop', 'book', 'clock', 'vase', 'lamp',
+        'person', 'wall',
+    })
+
     def __init__(self, use_dinov2: bool = False):
         """
         Initialize VisionMatchAgent with selected models
@@ -53,6 +66,47 @@ class VisionMatchAgent:
         else:
             self._load_clip_model()
 
+        # Torch inference runs on one dedicated thread so CUDA calls serialize
+        # there and the event loop stays free to decode the next upload
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vision")
+
+        # Pay model cold-start cost at startup instead of on the first request,
+        # on the same thread that will serve inference
+        self._executor.submit(self._warmup).result()
+
+    def close(self):
+        """Shut down the inference thread"""
+        self._executor.shutdown(wait=False)
+
+    def _warmup(self):
+        """Run one dummy forward pass through each loaded model"""
+        import time
+
+        start_time = time.time()
+        dummy = Image.new("RGB", (640, 640))
+        try:
+            if self.yolo_model is not None:
+                self.yolo_model(dummy, verbose=False)
+
+            if self.embedding_model is not None and self.embedding_processor is not None:
+                inputs = self.embedding_processor(
+                    images=dummy,
+                    return_tensors="pt"
+                ).to(self.device)
+
+                with torch.no_grad():
+                    if self.use_dinov2:
+                        self.embedding_model(**inputs)
+                    else:
+                        self.embedding_model.get_image_features(**inputs)
+
+            if self.device == "cuda":
+                torch.cuda.synchronize()
+
+            print(f"✓ Warmed up vision models in {time.time() - start_time:.2f}s")
+        except Exception as e:
+            print(f"⚠ Warning: Model warmup failed: {e}")
+
     def _load_yolo_model(self):
         """Load YOLOv8 model for object detection"""
         yolo_path = os.getenv("YOLO_MODEL_PATH", "yolov8n.pt")
@@ -98,14 +152,23 @@ class VisionMatchAgent:
 
     async def analyze_room(
         self, image: Image.Image, description: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Run analyze_room_sync on the inference thread without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, self.analyze_room_sync, image, description
+        )
+
+    def analyze_room_sync(
+        self, image: Image.Image, description: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Analyze a room image and return structured data
         
         This is the main analysis pipeline that orchestrates all vision tasks:
         1. Object detection (walls, furniture)
-        2. Color palette extraction (k-means)
-        3. Style embedding generation (CLIP/DINOv2)
+        2. Style embedding generation (CLIP/DINOv2)
+        3. Color palette extraction (k-means)
         4. Lighting analysis
         5. Wall space detection
 
@@ -123,7 +186,7 @@ class VisionMatchAgent:
                     "avg_brightness": 156.7,
                     "contrast": 0.45
                 },
-                "style_vector": [512-dimensional embedding],
+                "style_vector": "<base64 float16, 512 dims>",
                 "detected_objects": [...],
                 "wall_spaces": [...],
                 "style": "Modern Minimalist",
@@ -136,30 +199,29 @@ class VisionMatchAgent:
         print(f"🔍 Starting room analysis...")
 
         # 1. Detect walls and furniture using YOLOv8
-        detected_objects = await self._detect_objects(image)
+        # 2. Generate style embedding using CLIP or DINOv2
+        detected_objects = self._detect_objects(image)
+        style_vector = self._generate_style_embedding(image, description)
         print(f"  ✓ Detected {len(detected_objects)} objects")
+        print(f"  ✓ Generated {len(style_vector) if style_vector is not None else 0}-dim style vector")
 
-        # 2. Extract dominant color palette using k-means
-        palette = await self._extract_color_palette(image, n_colors=5)
+        # 3. Extract dominant color palette using k-means
+        palette = self._extract_color_palette(image, n_colors=5)
         print(f"  ✓ Extracted {len(palette)} dominant colors")
 
-        # 3. Generate style embedding using CLIP or DINOv2
-        style_vector = await self._generate_style_embedding(image, description)
-        print(f"  ✓ Generated {len(style_vector) if style_vector is not None else 0}-dim style vector")
-
         # 4. Analyze lighting conditions
-        lighting = await self._analyze_lighting_detailed(image)
+        lighting = self._analyze_lighting_detailed(image)
         print(f"  ✓ Analyzed lighting: {lighting['brightness']}")
 
         # 5. Identify wall spaces for art placement
-        wall_spaces = await self._detect_wall_spaces(detected_objects, image)
+        wall_spaces = self._detect_wall_spaces(detected_objects, image)
         print(f"  ✓ Detected {len(wall_spaces)} wall spaces")
 
         # 6. Classify room style based on embedding and objects
-        room_style = await self._classify_style(style_vector, detected_objects)
+        room_style = self._classify_style(style_vector, detected_objects)
         
         # 7. Calculate overall confidence
-        confidence_score = await self._calculate_confidence(
+        confidence_score = self._calculate_confidence(
             detected_objects, palette, style_vector
         )
 
@@ -169,7 +231,7 @@ class VisionMatchAgent:
         return {
             "palette": palette,
             "lighting": lighting,
-            "style_vector": style_vector.tolist() if style_vector is not None else None,
+            "style_vector": encode_style_vector(style_vector) if style_vector is not None else None,
             "detected_objects": detected_objects,
             "wall_spaces": wall_spaces,
             "style": room_style,
@@ -179,7 +241,7 @@ class VisionMatchAgent:
             "colors": palette,  # Alias for palette
         }
 
-    async def _detect_objects(self, image: Image.Image) -> List[Dict[str, Any]]:
+    def _detect_objects(self, image: Image.Image) -> List[Dict[str, Any]]:
         """
         Detect walls, furniture, and décor items using YOLOv8
         
@@ -203,13 +265,7 @@ class VisionMatchAgent:
             # Run YOLOv8 inference
             results = self.yolo_model(image, verbose=False)
             objects = []
-
-            # Relevant object categories for room analysis
-            relevant_categories = {
-                'couch', 'chair', 'bed', 'dining table', 'potted plant',
-                'tv', 'laptop', 'book', 'clock', 'vase', 'lamp',
-                'person'  # For scale reference
-            }
+            relevant = VisionMatchAgent._RELEVANT
 
             for result in results:
                 boxes = result.boxes
@@ -218,7 +274,7 @@ class VisionMatchAgent:
                     confidence = float(box.conf[0])
                     
                     # Filter by confidence and relevance
-                    if confidence > 0.3 and (label in relevant_categories or 'wall' in label.lower()):
+                    if confidence > 0.3 and (label in relevant or 'wall' in label.lower()):
                         bbox = box.xyxy[0].tolist()  # [x1, y1, x2, y2]
                         
                         objects.append({
@@ -267,7 +323,7 @@ class VisionMatchAgent:
             }
         ]
 
-    async def _generate_style_embedding(
+    def _generate_style_embedding(
         self, image: Image.Image, description: Optional[str] = None
     ) -> Optional[np.ndarray]:
         """
@@ -332,7 +388,7 @@ class VisionMatchAgent:
             # Return random embedding for testing
             return np.random.randn(512).astype(np.float32) / 10
 
-    async def _extract_color_palette(
+    def _extract_color_palette(
         self, image: Image.Image, n_colors: int = 5
     ) -> List[Dict[str, Any]]:
         """
@@ -364,26 +420,30 @@ class VisionMatchAgent:
             if len(filtered_pixels) < 100:
                 filtered_pixels = pixels  # Use all if too few remain
 
-            # K-means clustering for dominant colors
-            kmeans = KMeans(
-                n_clusters=min(n_colors, len(filtered_pixels)), 
-                random_state=42, 
-                n_init=10,
-                max_iter=300
+            # K-means clustering for dominant colors (OpenCV's C++ implementation)
+            n_clusters = min(n_colors, len(filtered_pixels))
+            criteria = (cv2.TERM_CRITERIA_EPS + cv2.TERM_CRITERIA_MAX_ITER, 50, 1.0)
+            cv2.setRNGSeed(42)
+            _, labels, centers = cv2.kmeans(
+                filtered_pixels.astype(np.float32),
+                n_clusters,
+                None,
+                criteria,
+                3,
+                cv2.KMEANS_PP_CENTERS
             )
-            kmeans.fit(filtered_pixels)
 
             # Get cluster sizes for percentages
-            labels = kmeans.labels_
-            label_counts = np.bincount(labels)
+            labels = labels.ravel()
+            label_counts = np.bincount(labels, minlength=n_clusters)
             total_pixels = len(labels)
 
+            # Clamp all centers to the valid range and convert once
+            centers_u8 = np.clip(centers, 0, 255).astype(np.uint8)
+
             colors = []
-            for idx, center in enumerate(kmeans.cluster_centers_):
-                r, g, b = center.astype(int)
-                
-                # Clamp values to valid range
-                r, g, b = np.clip([r, g, b], 0, 255)
+            for idx in range(len(centers_u8)):
+                r, g, b = (c.item() for c in centers_u8[idx])
                 
                 hex_color = f"#{r:02x}{g:02x}{b:02x}"
                 percentage = (label_counts[idx] / total_pixels) * 100
@@ -456,7 +516,7 @@ class VisionMatchAgent:
         
         return closest_name
 
-    async def _analyze_lighting_detailed(self, image: Image.Image) -> Dict[str, Any]:
+    def _analyze_lighting_detailed(self, image: Image.Image) -> Dict[str, Any]:
         """
         Analyze lighting conditions in detail
         
@@ -540,7 +600,7 @@ class VisionMatchAgent:
                 "dynamic_range": {"min": 0, "max": 255, "range": 255}
             }
 
-    async def _detect_wall_spaces(
+    def _detect_wall_spaces(
         self, detected_objects: List[Dict], image: Image.Image
     ) -> List[Dict[str, Any]]:
         """Identify available wall spaces for art"""
@@ -558,7 +618,7 @@ class VisionMatchAgent:
 
         return wall_spaces
 
-    async def _classify_style(
+    def _classify_style(
         self, embedding: Optional[np.ndarray], objects: List[Dict]
     ) -> str:
         """
@@ -581,22 +641,21 @@ class VisionMatchAgent:
         if not objects:
             return "Contemporary"
 
-        object_labels = [obj["label"].lower() for obj in objects]
-        object_str = " ".join(object_labels)
+        counts = Counter(obj["label"].lower() for obj in objects)
 
         # Count furniture pieces for density estimation
-        furniture_count = sum(1 for label in object_labels 
-                            if label in ['couch', 'chair', 'bed', 'dining table'])
+        furniture_count = (
+            counts["couch"] + counts["chair"] + counts["bed"] + counts["dining table"]
+        )
 
         # Modern/Minimalist: Few furniture pieces, clean lines
         if furniture_count <= 3:
-            if any(word in object_str for word in ["laptop", "tv", "book"]):
+            if counts["laptop"] or counts["tv"] or counts["book"]:
                 return "Modern Minimalist"
             return "Minimalist"
 
         # Bohemian: Many plants and decorative items
-        plant_count = sum(1 for label in object_labels if 'plant' in label)
-        if plant_count >= 2:
+        if counts["potted plant"] >= 2:
             return "Bohemian"
 
         # Traditional: Dense furniture arrangement
@@ -604,14 +663,14 @@ class VisionMatchAgent:
             return "Traditional"
 
         # Industrial: Sparse with utilitarian objects
-        if 'chair' in object_labels and 'lamp' in object_labels:
+        if counts["chair"] and counts["lamp"]:
             if furniture_count <= 4:
                 return "Industrial"
 
         # Default
         return "Contemporary"
 
-    async def _calculate_confidence(
+    def _calculate_confidence(
         self, 
         objects: List[Dict], 
         palette: List[Dict], 
@@ -3,82 +3,391 @@ FAISS vector database client for similarity search
 """
 
 import os
+import logging
+import functools
+import json
+import asyncio
 import pickle
-from typing import List, Tuple, Optional
+import threading
+from typing import Dict, List, Tuple, Optional
 import numpy as np
 import faiss
-from dotenv import load_dotenv
 
-load_dotenv()
+logger = logging.getLogger(__name__)
+
+
+# Below this many vectors an exact flat scan is fast enough and needs no training
+FLAT_INDEX_MAX_VECTORS = 10_000
+
+# Index files larger than this are memory-mapped instead of read into RAM
+MMAP_MIN_BYTES = 100 * 1024 * 1024
+
+# asearch() coalesces concurrent queries into one index.search call of at
+# most this many rows
+SEARCH_BATCH_MAX = 64
 
 
 class FAISSClient:
-    """FAISS vector database for artwork embeddings"""
+    """
+    FAISS vector database for artwork embeddings
+
+    The index, metadata and filter columns are published together as one
+    immutable snapshot tuple. Readers grab the current snapshot with a single
+    attribute read and never lock; writers build a new snapshot (copy-on-write)
+    under a writer lock and swap it in with one assignment.
+
+    Copy-on-write makes every add_vectors() call O(catalog size): the whole
+    index and metadata list are copied, and resident memory briefly holds
+    both versions. Add vectors in batches, not one row at a time.
+    """
 
     def __init__(self, index_path: Optional[str] = None):
         self.index_path = index_path or os.getenv(
             "FAISS_INDEX_PATH", "./data/artwork_vectors.index"
         )
-        self.metadata_path = self.index_path.replace(".index", "_metadata.pkl")
+        if index_path is None and os.getenv("FAISS_METADATA_PATH"):
+            self.metadata_path = os.getenv("FAISS_METADATA_PATH")
+        else:
+            self.metadata_path = self.index_path.replace(".index", "_metadata.jsonl")
+        # Metadata used to be a JSON array or a pickle; read once for migration
+        self.legacy_metadata_paths = [
+            self.index_path.replace(".index", "_metadata.json"),
+            self.index_path.replace(".index", "_metadata.pkl"),
+        ]
+
+        # Rows of the metadata journal known to match the in-memory metadata;
+        # None means the journal must be rewritten on the next save
+        self._journal_rows: Optional[int] = None
 
-        self.index: Optional[faiss.Index] = None
-        self.metadata: List[dict] = []
         self.dimension = 512  # CLIP embedding dimension
 
+        # (index, metadata, prices, style_codes, style_lookup, style_bitmaps);
+        # price and style columns are aligned with FAISS ids (see
+        # _build_filter_columns), style_bitmaps holds per-style ID selectors
+        # built once when the snapshot is published (see _build_style_bitmaps)
+        self._snapshot: tuple = (None, [], *_build_filter_columns([]), {})
+        self._write_lock = threading.Lock()
+
+        # Bounds concurrent asearch() calls to avoid oversubscribing cores
+        self._search_slots = asyncio.Semaphore(os.cpu_count() or 1)
+
+        # Per-thread (1, dimension) float32 buffer reused by single-query searches
+        self._query_buf = threading.local()
+        # Per-thread flat distance/label buffers FAISS writes search results into
+        self._result_buf = threading.local()
+
+        # asearch() micro-batching: queries arriving within the wait window are
+        # searched together (FAISS_BATCH_WAIT_MS=0 disables coalescing)
+        self.batch_wait = float(os.getenv("FAISS_BATCH_WAIT_MS", 5)) / 1000
+        self._batch_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending: List[tuple] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._batch_tasks: set = set()
+
+        # Approximate index used once the catalog outgrows the flat index:
+        # "ivf" (IVF-PQ, compact, needs training) or "hnsw" (graph, no training)
+        self.ann_type = os.getenv("FAISS_ANN", "ivf").lower()
+        if self.ann_type not in ("ivf", "hnsw"):
+            raise ValueError(f"FAISS_ANN must be 'ivf' or 'hnsw', got {self.ann_type!r}")
+
+        # IVF-PQ settings
+        self.nlist = int(os.getenv("FAISS_NLIST", 1024))
+        self.pq_spec = os.getenv("FAISS_PQ", "PQ32x8")
+        self.nprobe = int(os.getenv("FAISS_NPROBE", 16))
+        # PQ scores are rough; the top k * k_factor candidates are re-scored
+        # against fp16 copies of the vectors so similarities stay near-exact
+        self.refine_k_factor = float(os.getenv("FAISS_REFINE_K_FACTOR", 4))
+
+        # HNSW settings
+        self.hnsw_m = int(os.getenv("FAISS_HNSW_M", 32))
+        self.ef_construction = int(os.getenv("FAISS_HNSW_EF_CONSTRUCTION", 200))
+        self.ef_search = int(os.getenv("FAISS_HNSW_EF_SEARCH", 64))
+
+        # Set when the index is memory-mapped read-only; writes reload it first
+        self.use_mmap = os.getenv("FAISS_MMAP", "1") == "1"
+        self._read_only = False
+
+        _configure_omp_threads()
+
         # Load index if exists
         if os.path.exists(self.index_path):
             self.load_index()
         else:
-            print(f"FAISS index not found at {self.index_path}. Creating new index...")
+            logger.info("FAISS index not found at %s. Creating new index...", self.index_path)
             self.create_index()
 
+    @property
+    def index(self) -> Optional[faiss.Index]:
+        """FAISS index of the current snapshot"""
+        return self._snapshot[0]
+
+    @property
+    def metadata(self) -> List[dict]:
+        """Metadata of the current snapshot (do not mutate)"""
+        return self._snapshot[1]
+
     def create_index(self, dimension: int = 512):
         """Create a new FAISS index"""
-        self.dimension = dimension
-        # Using IndexFlatL2 for exact search (can be changed to IndexIVFFlat for larger datasets)
-        self.index = faiss.IndexFlatL2(dimension)
-        print(f"Created new FAISS index with dimension {dimension}")
+        with self._write_lock:
+            self.dimension = dimension
+            # Start with an exhaustive fp16 index; add_vectors migrates to IVF-PQ as the
+            # catalog grows. Vectors are normalized at ingest, so inner product is cosine.
+            self._read_only = False
+            self._journal_rows = None
+            self._snapshot = (
+                _new_flat_index(dimension), [], *_build_filter_columns([]), {}
+            )
+        logger.info("Created new FAISS index with dimension %s", dimension)
+
+    def _build_ivf_index(self, vectors: np.ndarray) -> faiss.Index:
+        """Train an IVF-PQ index with an fp16 re-ranking stage and add the vectors"""
+        index = faiss.index_factory(
+            self.dimension,
+            f"IVF{self.nlist},{self.pq_spec},Refine(SQfp16)",
+            faiss.METRIC_INNER_PRODUCT,
+        )
+        index.train(vectors)
+        index.add(vectors)
+        self._apply_search_params(index)
+        return index
+
+    def _build_hnsw_index(self, vectors: np.ndarray) -> faiss.Index:
+        """Build an fp16 HNSW graph index over the given vectors"""
+        index = faiss.IndexHNSWSQ(
+            self.dimension, faiss.ScalarQuantizer.QT_fp16, self.hnsw_m,
+            faiss.METRIC_INNER_PRODUCT,
+        )
+        index.hnsw.efConstruction = self.ef_construction
+        index.add(vectors)
+        index.hnsw.efSearch = self.ef_search
+        return index
+
+    def _maybe_migrate_to_ann(self, index: faiss.Index) -> faiss.Index:
+        """
+        Replace a flat index with an approximate one once enough vectors are stored
+
+        The flat index doubles as the training buffer: IVF training needs
+        roughly 39 vectors per list, so IVF migration waits for 39 * nlist
+        vectors. HNSW needs no training and migrates at FLAT_INDEX_MAX_VECTORS.
+        """
+        if _is_ivf(index) or _is_hnsw(index):
+            return index
+
+        ntotal = index.ntotal
+        if self.ann_type == "hnsw":
+            if ntotal < FLAT_INDEX_MAX_VECTORS:
+                return index
+            vectors = index.reconstruct_n(0, ntotal)
+            logger.info("Migrating FAISS index to HNSW%s (%s vectors)", self.hnsw_m, ntotal)
+            return self._build_hnsw_index(vectors)
+
+        if ntotal < max(FLAT_INDEX_MAX_VECTORS, 39 * self.nlist):
+            return index
+
+        vectors = index.reconstruct_n(0, ntotal)
+        logger.info("Migrating FAISS index to IVF%s,%s (%s vectors)", self.nlist, self.pq_spec, ntotal)
+        return self._build_ivf_index(vectors)
+
+    def _read_index(self) -> faiss.Index:
+        """
+        Read the index from disk, memory-mapping large files
+
+        mmap lets the OS page cache hold hot inverted lists instead of loading
+        the whole file into RSS. Index types that cannot be mapped are read
+        normally.
+        """
+        self._read_only = False
+        if self.use_mmap and os.path.getsize(self.index_path) > MMAP_MIN_BYTES:
+            try:
+                index = faiss.read_index(
+                    self.index_path, faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY
+                )
+                self._read_only = True
+                return index
+            except RuntimeError as e:
+                logger.warning("FAISS index cannot be memory-mapped, reading into memory: %s", e)
+        return faiss.read_index(self.index_path)
+
+    def _writable_copy(self, index: faiss.Index) -> faiss.Index:
+        """Private copy of the index for a writer to mutate"""
+        if self._read_only:
+            # A memory-mapped index cannot be written; load an in-memory copy instead
+            copy = faiss.read_index(self.index_path)
+            self._apply_search_params(copy)
+            self._read_only = False
+            return copy
+        return faiss.clone_index(index)
+
+    def _migrate_legacy_flat_index(self, index: faiss.Index) -> faiss.Index:
+        """Convert indexes saved as float32 IndexFlatL2/IndexFlatIP to fp16 inner product"""
+        if isinstance(index, faiss.IndexFlat):
+            vectors = index.reconstruct_n(0, index.ntotal)
+            index = _new_flat_index(index.d)
+            index.add(vectors)
+            self._read_only = False
+            logger.info("Converted legacy float32 flat index to fp16 inner product")
+        return index
+
+    def _apply_search_params(self, index: faiss.Index):
+        """Apply nprobe / k_factor / efSearch to IVF / HNSW indexes (no-op for flat indexes)"""
+        if isinstance(index, faiss.IndexRefine):
+            index.k_factor = self.refine_k_factor
+        if _is_ivf(index):
+            faiss.extract_index_ivf(index).nprobe = self.nprobe
+        elif _is_hnsw(index):
+            index.hnsw.efSearch = self.ef_search
+
+    def _search_params(
+        self, index: faiss.Index, selector: faiss.IDSelector
+    ) -> faiss.SearchParameters:
+        """Search parameters restricting the search to selector for this index type"""
+        if isinstance(index, faiss.IndexRefine):
+            # The selector restricts the IVF candidates; re-ranking only sees those
+            base_params = faiss.SearchParametersIVF(sel=selector, nprobe=self.nprobe)
+            params = faiss.IndexRefineSearchParameters(
+                k_factor=self.refine_k_factor, base_index_params=base_params
+            )
+            # SWIG does not own base_params; keep it alive with the wrapper
+            params.referenced_objects = [base_params]
+            return params
+        if _is_ivf(index):
+            return faiss.SearchParametersIVF(sel=selector, nprobe=self.nprobe)
+        if _is_hnsw(index):
+            return faiss.SearchParametersHNSW(sel=selector, efSearch=self.ef_search)
+        return faiss.SearchParameters(sel=selector)
 
     def save_index(self):
-        """Save FAISS index and metadata to disk"""
+        """
+        Save FAISS index and metadata to disk
+
+        The index is written to a ``.tmp`` sibling and renamed over the original
+        with os.replace, so a crash mid-write never leaves a truncated file
+        behind. Metadata is an append-only JSON-lines journal: only rows added
+        since the last save are written, and the file is compacted (rewritten
+        atomically) only when it no longer matches the index.
+        """
+        index_tmp = self.index_path + ".tmp"
         try:
             os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
 
-            # Save FAISS index
-            faiss.write_index(self.index, self.index_path)
+            with self._write_lock:
+                index, metadata = self._snapshot[:2]
+
+                # Save FAISS index
+                faiss.write_index(index, index_tmp)
+
+                # Save metadata
+                self._save_metadata_journal(metadata)
 
-            # Save metadata
-            with open(self.metadata_path, "wb") as f:
-                pickle.dump(self.metadata, f)
+                os.replace(index_tmp, self.index_path)
 
-            print(f"Saved FAISS index to {self.index_path}")
+            logger.info("Saved FAISS index to %s", self.index_path)
         except Exception as e:
-            print(f"Error saving FAISS index: {e}")
+            logger.warning("Error saving FAISS index: %s", e)
             raise
 
     def load_index(self):
         """Load FAISS index and metadata from disk"""
         try:
-            self.index = faiss.read_index(self.index_path)
-
-            # Load metadata
-            if os.path.exists(self.metadata_path):
-                with open(self.metadata_path, "rb") as f:
-                    self.metadata = pickle.load(f)
-
-            print(
-                f"Loaded FAISS index from {self.index_path} with {self.index.ntotal} vectors"
+            with self._write_lock:
+                index = self._read_index()
+                index = self._migrate_legacy_flat_index(index)
+                self._apply_search_params(index)
+                self.dimension = index.d
+
+                # Load metadata
+                metadata = self._load_metadata()
+                if len(metadata) != index.ntotal:
+                    self._journal_rows = None
+                metadata = _align_metadata(metadata, index.ntotal)
+                prices, style_codes, style_lookup = _build_filter_columns(metadata)
+                self._snapshot = (
+                    index,
+                    metadata,
+                    prices,
+                    style_codes,
+                    style_lookup,
+                    _build_style_bitmaps(style_codes, style_lookup),
+                )
+
+            logger.info(
+                "Loaded FAISS index from %s with %s vectors", self.index_path, index.ntotal
             )
         except Exception as e:
-            print(f"Error loading FAISS index: {e}")
+            logger.warning("Error loading FAISS index: %s", e)
             raise
 
+    def _load_metadata(self) -> List[dict]:
+        """Read the metadata journal, falling back to legacy JSON/pickle files"""
+        self._journal_rows = None
+        if os.path.exists(self.metadata_path):
+            metadata: List[dict] = []
+            clean = True
+            with open(self.metadata_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        row = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Torn final append from a crash; compact on next save
+                        logger.warning("Ignoring incomplete entry at the end of the metadata journal")
+                        clean = False
+                        break
+                    if isinstance(row, list):
+                        # Whole file is a legacy JSON array
+                        metadata.extend(row)
+                        clean = False
+                    else:
+                        metadata.append(row)
+            if clean:
+                self._journal_rows = len(metadata)
+            return metadata
+
+        for path in self.legacy_metadata_paths:
+            if os.path.exists(path):
+                if path.endswith(".pkl"):
+                    with open(path, "rb") as f:
+                        metadata = pickle.load(f)
+                else:
+                    with open(path, "r", encoding="utf-8") as f:
+                        metadata = json.load(f)
+                logger.info(
+                    "Loaded legacy metadata from %s; it will be saved to %s",
+                    path,
+                    self.metadata_path,
+                )
+                return metadata
+        return []
+
+    def _save_metadata_journal(self, metadata: List[dict]):
+        """Append unsaved rows to the metadata journal, or compact it if out of sync"""
+        if self._journal_rows is None or self._journal_rows > len(metadata):
+            metadata_tmp = self.metadata_path + ".tmp"
+            with open(metadata_tmp, "w", encoding="utf-8") as f:
+                for row in metadata:
+                    f.write(json.dumps(row) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(metadata_tmp, self.metadata_path)
+        elif self._journal_rows < len(metadata):
+            with open(self.metadata_path, "a", encoding="utf-8") as f:
+                for row in metadata[self._journal_rows:]:
+                    f.write(json.dumps(row) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+        self._journal_rows = len(metadata)
+
     def add_vectors(
         self, vectors: np.ndarray, metadata: List[dict]
     ) -> List[int]:
         """
         Add vectors to the index with associated metadata
 
+        The current index is copied, extended and published as a new snapshot,
+        so concurrent searches keep using the previous one untouched. Each call
+        therefore costs a full index and metadata copy (and briefly twice the
+        index's memory) regardless of len(vectors): callers must batch adds
+        into as few calls as possible.
+
         Args:
             vectors: numpy array of shape (n, dimension)
             metadata: list of metadata dicts for each vector
@@ -86,75 +395,256 @@ class FAISSClient:
         Returns:
             List of IDs for the added vectors
         """
+        if len(metadata) != len(vectors):
+            raise ValueError(
+                f"Got {len(vectors)} vectors but {len(metadata)} metadata entries"
+            )
+
         if self.index is None:
             self.create_index()
 
         # Ensure vectors are float32
         vectors = vectors.astype(np.float32)
 
-        # Normalize vectors for cosine similarity (optional)
+        # Normalize once at ingest so inner product equals cosine similarity
         faiss.normalize_L2(vectors)
 
-        # Get starting ID
-        start_id = self.index.ntotal
+        with self._write_lock:
+            index, old_metadata, prices, style_codes, style_lookup = self._snapshot[:5]
+            new_index = self._writable_copy(index)
 
-        # Add to index
-        self.index.add(vectors)
+            # Get starting ID
+            start_id = new_index.ntotal
 
-        # Add metadata
-        self.metadata.extend(metadata)
+            # Add to index
+            new_index.add(vectors)
+            new_index = self._maybe_migrate_to_ann(new_index)
+
+            # Add metadata; FAISS id i always maps to new_metadata[i]
+            new_metadata = old_metadata + list(metadata)
+            assert len(new_metadata) == new_index.ntotal
+            new_prices, new_codes, new_lookup = _build_filter_columns(
+                metadata, dict(style_lookup)
+            )
+            style_codes = np.concatenate([style_codes, new_codes])
+            self._snapshot = (
+                new_index,
+                new_metadata,
+                np.concatenate([prices, new_prices]),
+                style_codes,
+                new_lookup,
+                _build_style_bitmaps(style_codes, new_lookup),
+            )
 
         # Return IDs
-        ids = list(range(start_id, self.index.ntotal))
-        print(f"Added {len(vectors)} vectors to FAISS index")
+        ids = list(range(start_id, start_id + len(vectors)))
+        logger.info("Added %s vectors to FAISS index", len(vectors))
 
         return ids
 
     def search(
-        self, query_vector: np.ndarray, k: int = 10
-    ) -> Tuple[List[float], List[dict]]:
+        self, query_vector: np.ndarray, k: int = 10, assume_normalized: bool = False
+    ) -> Tuple[np.ndarray, List[dict]]:
         """
         Search for k nearest neighbors
 
         Args:
             query_vector: numpy array of shape (dimension,) or (1, dimension)
             k: number of nearest neighbors to return
+            assume_normalized: skip query normalization for unit-length queries
 
         Returns:
-            Tuple of (distances, metadata) for k nearest neighbors
+            Tuple of (similarities, metadata) for k nearest neighbors;
+            similarities are a float32 array of cosine scores in [-1, 1],
+            highest first
         """
-        if self.index is None or self.index.ntotal == 0:
-            print("FAISS index is empty")
-            return [], []
+        query = self._load_query(query_vector, assume_normalized)
+        distances, metadata = self.search_batch(query, k, assume_normalized=True)
+        return distances[0], metadata[0]
 
-        # Ensure query vector is 2D and float32
-        if query_vector.ndim == 1:
-            query_vector = query_vector.reshape(1, -1)
-        query_vector = query_vector.astype(np.float32)
+    def _load_query(self, query_vector: np.ndarray, assume_normalized: bool) -> np.ndarray:
+        """
+        Copy a single query into this thread's reusable (1, dimension) buffer
 
-        # Normalize for cosine similarity
-        faiss.normalize_L2(query_vector)
+        Avoids the reshape/astype allocations on every search; the buffer is
+        thread-local because asearch() runs searches on worker threads.
+        """
+        buf = getattr(self._query_buf, "arr", None)
+        if buf is None or buf.shape[1] != self.dimension:
+            buf = np.empty((1, self.dimension), dtype=np.float32)
+            self._query_buf.arr = buf
 
-        # Search
-        distances, indices = self.index.search(query_vector, min(k, self.index.ntotal))
+        np.copyto(buf, np.reshape(query_vector, (1, -1)), casting="unsafe")
+        if not assume_normalized:
+            faiss.normalize_L2(buf)
+        return buf
+
+    def _result_buffers(self, n: int, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return this thread's (n, k) distance and label output arrays
+
+        Backed by flat buffers that only grow, so repeated searches reuse one
+        allocation; callers must copy anything they keep past the next search.
+        """
+        size = n * k
+        distances = getattr(self._result_buf, "distances", None)
+        if distances is None or distances.size < size:
+            distances = np.empty(size, dtype=np.float32)
+            self._result_buf.distances = distances
+            self._result_buf.labels = np.empty(size, dtype=np.int64)
+        labels = self._result_buf.labels
+        return distances[:size].reshape(n, k), labels[:size].reshape(n, k)
+
+    async def asearch(
+        self, query_vector: np.ndarray, k: int = 10, assume_normalized: bool = False
+    ) -> Tuple[np.ndarray, List[dict]]:
+        """
+        Async variant of search() for request handlers
+
+        Concurrent calls are coalesced for up to FAISS_BATCH_WAIT_MS (or
+        SEARCH_BATCH_MAX queries) and answered by a single batched
+        index.search, which FAISS runs as one matrix product instead of
+        many vector products. The search runs in a worker thread (FAISS
+        releases the GIL), keeping the event loop free.
+        """
+        index = self._snapshot[0]
+        if index is None or index.ntotal == 0:
+            # Nothing to search: skip the batching window and thread hop
+            return np.empty(0, dtype=np.float32), []
+
+        if self.batch_wait <= 0:
+            async with self._search_slots:
+                return await asyncio.to_thread(self.search, query_vector, k, assume_normalized)
+
+        # Validate here so one malformed query cannot fail a whole batch
+        query = np.asarray(query_vector, dtype=np.float32).reshape(-1)
+        if query.shape[0] != self.dimension:
+            raise ValueError(
+                f"Query has {query.shape[0]} dimensions, index expects {self.dimension}"
+            )
+
+        loop = asyncio.get_running_loop()
+        if self._batch_loop is not loop:
+            # First use, or the previous event loop is gone (e.g. scripts)
+            self._batch_loop = loop
+            self._pending = []
+            self._flush_handle = None
+
+        future = loop.create_future()
+        self._pending.append((query, k, assume_normalized, future))
+        if len(self._pending) >= SEARCH_BATCH_MAX:
+            self._flush_pending()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_wait, self._flush_pending)
+        return await future
+
+    def _flush_pending(self):
+        """Start a batched search for all queued asearch() calls"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._search_pending(batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _search_pending(self, batch: List[tuple]):
+        """
+        Run one search for a batch of (query, k, assume_normalized, future)
+        and resolve the futures
+        """
+        k_max = max(k for _, k, _, _ in batch)
+        # Normalizing an already unit-length query is harmless, so only skip
+        # it when every query in the batch is normalized
+        assume_normalized = all(normalized for _, _, normalized, _ in batch)
+        try:
+            async with self._search_slots:
+                distances, metadata = await asyncio.to_thread(
+                    self.search_batch,
+                    np.stack([query for query, _, _, _ in batch]),
+                    k_max,
+                    assume_normalized,
+                )
+        except Exception as e:
+            for _, _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, k, _, future), row_distances, row_metadata in zip(batch, distances, metadata):
+            if not future.done():
+                future.set_result((row_distances[:k], row_metadata[:k]))
+
+    def search_batch(
+        self,
+        queries: np.ndarray,
+        k: int = 10,
+        assume_normalized: bool = False,
+        params: Optional[faiss.SearchParameters] = None,
+        snapshot: Optional[tuple] = None,
+    ) -> Tuple[List[np.ndarray], List[List[dict]]]:
+        """
+        Search for k nearest neighbors of several queries in one FAISS call
+
+        Args:
+            queries: numpy array of shape (n, dimension) or (dimension,)
+            k: number of nearest neighbors to return per query
+            assume_normalized: skip query normalization for unit-length queries
+            params: optional FAISS search parameters (e.g. an ID selector)
+            snapshot: snapshot to search (defaults to the current one)
+
+        Returns:
+            Tuple of (similarities, metadata) per query; similarities stay
+            float32 arrays so callers can post-process them vectorized
+        """
+        index, metadata = (snapshot or self._snapshot)[:2]
+
+        # Ensure queries are 2D float32; copy only when normalizing in place
+        if assume_normalized:
+            queries = np.ascontiguousarray(queries, dtype=np.float32)
+        else:
+            queries = np.array(queries, dtype=np.float32)
+        if queries.ndim == 1:
+            queries = queries[np.newaxis]
+
+        if index is None or index.ntotal == 0:
+            logger.debug("FAISS index is empty")
+            return [np.empty(0, dtype=np.float32) for _ in queries], [[] for _ in queries]
 
-        # Get metadata for results
-        results_metadata = []
-        results_distances = []
+        # Normalize for cosine similarity
+        if not assume_normalized:
+            faiss.normalize_L2(queries)
 
-        for dist, idx in zip(distances[0], indices[0]):
-            if idx < len(self.metadata):
-                results_distances.append(float(dist))
-                results_metadata.append(self.metadata[idx])
+        # Search
+        k = min(k, index.ntotal)
+        distances, indices = self._result_buffers(len(queries), k)
+        index.search(queries, k, params=params, D=distances, I=indices)
+
+        # Get metadata for results. Metadata length always equals ntotal, so the
+        # only invalid ids are the -1 padding IVF/selector searches emit. The
+        # boolean-mask indexing copies rows out of the reused result buffers.
+        found = indices >= 0
+        results_distances = [
+            row_distances[row_found]
+            for row_distances, row_found in zip(distances, found)
+        ]
+        results_metadata = [
+            [metadata[idx] for idx in row_indices[row_found].tolist()]
+            for row_indices, row_found in zip(indices, found)
+        ]
 
         return results_distances, results_metadata
 
     def search_by_style(
         self, style_embedding: np.ndarray, filters: Optional[dict] = None, k: int = 20
-    ) -> Tuple[List[float], List[dict]]:
+    ) -> Tuple[np.ndarray, List[dict]]:
         """
         Search for artworks matching a style embedding with optional filters
 
+        Filters are evaluated inside FAISS through an ID selector, so exactly
+        the k best matching artworks are returned without over-fetching.
+
         Args:
             style_embedding: Style vector from room analysis
             filters: Dict of filters (e.g., {"price_range": [0, 500]})
@@ -163,51 +653,170 @@ class FAISSClient:
         Returns:
             Tuple of (scores, metadata)
         """
-        # Get more results than needed for filtering
-        search_k = k * 3 if filters else k
-        distances, results = self.search(style_embedding, k=search_k)
-
-        # Apply filters if provided
-        if filters:
-            filtered_distances = []
-            filtered_results = []
-
-            for dist, meta in zip(distances, results):
-                # Example filter: price range
-                if "price_range" in filters:
-                    price = meta.get("price", 0)
-                    min_price, max_price = filters["price_range"]
-                    if not (min_price <= price <= max_price):
-                        continue
-
-                # Example filter: style match
-                if "style" in filters:
-                    if meta.get("style") != filters["style"]:
-                        continue
-
-                filtered_distances.append(dist)
-                filtered_results.append(meta)
+        snapshot = self._snapshot
+        index = snapshot[0]
+        if not filters or index is None or index.ntotal == 0:
+            query = self._load_query(style_embedding, assume_normalized=False)
+            distances, results = self.search_batch(
+                query, k=k, assume_normalized=True, snapshot=snapshot
+            )
+            return distances[0], results[0]
 
-                if len(filtered_results) >= k:
-                    break
+        if filters.keys() == {"style"}:
+            # Most common filter: reuse the snapshot's precomputed style bitmap
+            bitmap = snapshot[5].get(filters["style"])
+        else:
+            bitmap = _packed_bitmap(_filter_mask(snapshot, filters))
+        if bitmap is None:
+            return np.empty(0, dtype=np.float32), []
 
-            return filtered_distances[:k], filtered_results[:k]
+        # The bitmap stays referenced (locally or in the snapshot) until the search returns
+        selector = faiss.IDSelectorBitmap(index.ntotal, faiss.swig_ptr(bitmap))
+        params = self._search_params(index, selector)
 
-        return distances[:k], results[:k]
+        query = self._load_query(style_embedding, assume_normalized=False)
+        distances, results = self.search_batch(
+            query, k=k, assume_normalized=True, params=params, snapshot=snapshot
+        )
+        return distances[0], results[0]
 
     def get_total_vectors(self) -> int:
         """Get total number of vectors in index"""
-        return self.index.ntotal if self.index else 0
-
-
-# Singleton instance
-_faiss_client: Optional[FAISSClient] = None
-
-
+        index = self.index
+        return index.ntotal if index else 0
+
+
+def _build_filter_columns(
+    metadata: List[dict], style_lookup: Optional[Dict[str, int]] = None
+) -> Tuple[np.ndarray, np.ndarray, Dict[str, int]]:
+    """
+    Build price and style columns for the given metadata rows
+
+    Styles are stored as categorical int codes; new styles are added to
+    style_lookup (a fresh dict when omitted).
+
+    Returns:
+        Tuple of (prices, style_codes, style_lookup)
+    """
+    lookup = {} if style_lookup is None else style_lookup
+    prices = np.array([_price_of(meta) for meta in metadata], dtype=np.float32)
+    codes = np.array(
+        [lookup.setdefault(meta.get("style"), len(lookup)) for meta in metadata],
+        dtype=np.int32,
+    )
+    return prices, codes, lookup
+
+
+def _filter_mask(snapshot: tuple, filters: dict) -> np.ndarray:
+    """Boolean mask over FAISS ids of vectors matching all filters"""
+    index, _, prices, style_codes, style_lookup = snapshot[:5]
+    mask = np.ones(index.ntotal, dtype=bool)
+
+    if "price_range" in filters:
+        min_price, max_price = filters["price_range"]
+        mask &= (prices >= min_price) & (prices <= max_price)
+
+    if "style" in filters:
+        code = style_lookup.get(filters["style"])
+        if code is None:
+            return np.zeros(index.ntotal, dtype=bool)
+        mask &= style_codes == code
+
+    return mask
+
+
+def _packed_bitmap(mask: np.ndarray) -> Optional[np.ndarray]:
+    """Pack a boolean mask into the bit layout of IDSelectorBitmap (None if empty)"""
+    if not mask.any():
+        return None
+    return np.packbits(mask, bitorder="little")
+
+
+def _build_style_bitmaps(
+    style_codes: np.ndarray, style_lookup: Dict[str, int]
+) -> Dict[str, np.ndarray]:
+    """
+    Packed ID bitmap per style present in the snapshot
+
+    Acts as a pre-aggregated style shard: style-filtered searches skip
+    building the mask and only pay for the selector check inside FAISS.
+    Built before the snapshot is published, so readers never write to it.
+    """
+    bitmaps = {}
+    for style, code in style_lookup.items():
+        bitmap = _packed_bitmap(style_codes == code)
+        if bitmap is not None:
+            bitmaps[style] = bitmap
+    return bitmaps
+
+
+def _configure_omp_threads():
+    """
+    Size FAISS's OpenMP pool so uvicorn workers do not oversubscribe cores
+
+    Every worker process gets its own pool, which defaults to all cores.
+    FAISS_OMP_THREADS overrides the default of cpu_count // WEB_CONCURRENCY.
+    """
+    workers = max(1, int(os.getenv("WEB_CONCURRENCY", 1)))
+    default_threads = max(1, (os.cpu_count() or 1) // workers)
+    threads = int(os.getenv("FAISS_OMP_THREADS", default_threads))
+    faiss.omp_set_num_threads(threads)
+    logger.info("FAISS using %s OpenMP threads", threads)
+
+
+def _align_metadata(metadata: List[dict], ntotal: int) -> List[dict]:
+    """
+    Make metadata exactly ntotal rows long so FAISS ids always index into it
+
+    Files written by older versions could disagree with the index after a
+    crash between the two writes; missing rows are padded with empty dicts
+    and extra rows dropped.
+    """
+    if len(metadata) == ntotal:
+        return metadata
+    logger.warning(
+        "FAISS metadata has %s rows but index has %s vectors; realigning",
+        len(metadata),
+        ntotal,
+    )
+    return metadata[:ntotal] + [{} for _ in range(ntotal - len(metadata))]
+
+
+def _new_flat_index(dimension: int) -> faiss.Index:
+    """
+    Exhaustive inner-product index storing vectors as float16
+
+    Halves memory and scan bandwidth versus IndexFlatIP (1 KB per 512-dim
+    vector); fp16 precision is ample for ranking unit-length embeddings.
+    """
+    return faiss.IndexScalarQuantizer(
+        dimension, faiss.ScalarQuantizer.QT_fp16, faiss.METRIC_INNER_PRODUCT
+    )
+
+
+def _is_ivf(index: faiss.Index) -> bool:
+    """Whether the index is IVF-based"""
+    try:
+        faiss.extract_index_ivf(index)
+        return True
+    except RuntimeError:
+        return False
+
+
+def _is_hnsw(index: faiss.Index) -> bool:
+    """Whether the index is an HNSW graph"""
+    return isinstance(index, faiss.IndexHNSW)
+
+
+def _price_of(meta: dict) -> float:
+    """Numeric price from metadata; unparsable prices become NaN and match no range"""
+    try:
+        return float(meta.get("price", 0))
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+@functools.cache
 def get_faiss_client() -> FAISSClient:
     """Get or create FAISS client singleton"""
-    global _faiss_client
-    if _faiss_client is None:
-        _faiss_client = FAISSClient()
-    return _faiss_client
-
+    return FAISSClient()
@@ -3,15 +3,29 @@ Supabase database client for PostgreSQL operations
 """
 
 import os
-from typing import Optional, List, Dict, Any
-from supabase import create_client, Client
-from dotenv import load_dotenv
+import logging
+import functools
+from typing import Optional, List, Dict, Any, AsyncIterator
+from cachetools import TTLCache
+from postgrest import AsyncPostgrestClient
+from postgrest.types import CountMethod
 
-load_dotenv()
+logger = logging.getLogger(__name__)
+
+# Seconds a user's favorites list is served from memory
+FAVORITES_CACHE_TTL = 60
+
+# Artwork metadata is read-only for the API, so it can be cached longer
+ARTWORK_CACHE_TTL = 300
 
 
 class SupabaseClient:
-    """Wrapper for Supabase operations"""
+    """
+    Wrapper for Supabase operations
+
+    Talks to Supabase's PostgREST API through an async client that keeps one
+    pooled HTTP/2 connection, so queries never block the event loop.
+    """
 
     def __init__(self):
         supabase_url = os.getenv("SUPABASE_URL")
@@ -20,25 +34,37 @@ class SupabaseClient:
         if not supabase_url or not supabase_key:
             raise ValueError("SUPABASE_URL and SUPABASE_KEY must be set in environment")
 
-        self.client: Client = create_client(supabase_url, supabase_key)
+        self.client = AsyncPostgrestClient(
+            f"{supabase_url.rstrip('/')}/rest/v1",
+            headers={"apikey": supabase_key, "Authorization": f"Bearer {supabase_key}"},
+        )
+
+        # In-process caches; only touched from the event loop, so no locking
+        self._favorites_cache = TTLCache(maxsize=10_000, ttl=FAVORITES_CACHE_TTL)
+        self._artwork_cache = TTLCache(maxsize=10_000, ttl=ARTWORK_CACHE_TTL)
+        self._artwork_list_cache = TTLCache(maxsize=1_000, ttl=ARTWORK_CACHE_TTL)
+
+    async def close(self):
+        """Close pooled HTTP connections"""
+        await self.client.aclose()
 
     # User Profile Operations
     async def get_user_profile(self, user_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve user profile by ID"""
         try:
-            response = self.client.table("profiles").select("*").eq("id", user_id).execute()
+            response = await self.client.table("profiles").select("*").eq("id", user_id).execute()
             return response.data[0] if response.data else None
         except Exception as e:
-            print(f"Error fetching user profile: {e}")
+            logger.warning("Error fetching user profile: %s", e)
             return None
 
     async def create_user_profile(self, profile_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new user profile"""
         try:
-            response = self.client.table("profiles").insert(profile_data).execute()
+            response = await self.client.table("profiles").insert(profile_data).execute()
             return response.data[0]
         except Exception as e:
-            print(f"Error creating user profile: {e}")
+            logger.warning("Error creating user profile: %s", e)
             raise
 
     async def update_user_profile(
@@ -46,7 +72,7 @@ class SupabaseClient:
     ) -> Dict[str, Any]:
         """Update existing user profile"""
         try:
-            response = (
+            response = await (
                 self.client.table("profiles")
                 .update(profile_data)
                 .eq("id", user_id)
@@ -54,25 +80,39 @@ class SupabaseClient:
             )
             return response.data[0]
         except Exception as e:
-            print(f"Error updating user profile: {e}")
+            logger.warning("Error updating user profile: %s", e)
             raise
 
     # Artwork Metadata Operations
     async def get_artwork_by_id(self, artwork_id: str) -> Optional[Dict[str, Any]]:
-        """Retrieve artwork metadata by ID"""
+        """Retrieve artwork metadata by ID (cached for ARTWORK_CACHE_TTL seconds)"""
+        cached = self._artwork_cache.get(artwork_id)
+        if cached is not None:
+            return cached
+
         try:
-            response = (
+            response = await (
                 self.client.table("artworks").select("*").eq("id", artwork_id).execute()
             )
-            return response.data[0] if response.data else None
+            if not response.data:
+                return None
+            self._artwork_cache[artwork_id] = response.data[0]
+            return response.data[0]
         except Exception as e:
-            print(f"Error fetching artwork: {e}")
+            logger.warning("Error fetching artwork: %s", e)
             return None
 
     async def get_artworks(
         self, filters: Optional[Dict[str, Any]] = None, limit: int = 50
     ) -> List[Dict[str, Any]]:
-        """Retrieve artworks with optional filters"""
+        """Retrieve artworks with optional filters (cached for ARTWORK_CACHE_TTL seconds)"""
+        try:
+            cache_key = (frozenset((filters or {}).items()), limit)
+        except TypeError:
+            cache_key = None  # unhashable filter values are not cached
+        if cache_key is not None and cache_key in self._artwork_list_cache:
+            return self._artwork_list_cache[cache_key]
+
         try:
             query = self.client.table("artworks").select("*")
 
@@ -80,10 +120,12 @@ class SupabaseClient:
                 for key, value in filters.items():
                     query = query.eq(key, value)
 
-            response = query.limit(limit).execute()
+            response = await query.limit(limit).execute()
+            if cache_key is not None:
+                self._artwork_list_cache[cache_key] = response.data
             return response.data
         except Exception as e:
-            print(f"Error fetching artworks: {e}")
+            logger.warning("Error fetching artworks: %s", e)
             return []
 
     async def search_artworks_by_style(
@@ -91,7 +133,7 @@ class SupabaseClient:
     ) -> List[Dict[str, Any]]:
         """Search artworks by style"""
         try:
-            response = (
+            response = await (
                 self.client.table("artworks")
                 .select("*")
                 .ilike("style", f"%{style}%")
@@ -100,7 +142,7 @@ class SupabaseClient:
             )
             return response.data
         except Exception as e:
-            print(f"Error searching artworks: {e}")
+            logger.warning("Error searching artworks: %s", e)
             return []
 
     # Room Analysis History
@@ -116,10 +158,10 @@ class SupabaseClient:
                 "lighting": analysis_data.get("lighting"),
                 "metadata": analysis_data,
             }
-            response = self.client.table("room_analyses").insert(data).execute()
+            response = await self.client.table("room_analyses").insert(data).execute()
             return response.data[0]
         except Exception as e:
-            print(f"Error saving room analysis: {e}")
+            logger.warning("Error saving room analysis: %s", e)
             raise
 
     async def get_user_room_analyses(
@@ -127,7 +169,7 @@ class SupabaseClient:
     ) -> List[Dict[str, Any]]:
         """Get user's room analysis history"""
         try:
-            response = (
+            response = await (
                 self.client.table("room_analyses")
                 .select("*")
                 .eq("user_id", user_id)
@@ -137,7 +179,7 @@ class SupabaseClient:
             )
             return response.data
         except Exception as e:
-            print(f"Error fetching room analyses: {e}")
+            logger.warning("Error fetching room analyses: %s", e)
             return []
 
     # Favorites
@@ -145,46 +187,83 @@ class SupabaseClient:
         """Add artwork to user favorites"""
         try:
             data = {"user_id": user_id, "artwork_id": artwork_id}
-            response = self.client.table("favorites").insert(data).execute()
+            response = await self.client.table("favorites").insert(data).execute()
+            self._favorites_cache.pop(user_id, None)
             return response.data[0]
         except Exception as e:
-            print(f"Error adding favorite: {e}")
+            logger.warning("Error adding favorite: %s", e)
             raise
 
     async def remove_favorite(self, user_id: str, artwork_id: str) -> bool:
         """Remove artwork from user favorites"""
         try:
-            self.client.table("favorites").delete().eq("user_id", user_id).eq(
+            await self.client.table("favorites").delete().eq("user_id", user_id).eq(
                 "artwork_id", artwork_id
             ).execute()
+            self._favorites_cache.pop(user_id, None)
             return True
         except Exception as e:
-            print(f"Error removing favorite: {e}")
+            logger.warning("Error removing favorite: %s", e)
             return False
 
     async def get_user_favorites(self, user_id: str) -> List[Dict[str, Any]]:
-        """Get user's favorite artworks"""
+        """Get user's favorite artworks (cached for FAVORITES_CACHE_TTL seconds)"""
+        cached = self._favorites_cache.get(user_id)
+        if cached is not None:
+            return cached
+
         try:
-            response = (
+            response = await (
                 self.client.table("favorites")
                 .select("*, artworks(*)")
                 .eq("user_id", user_id)
                 .execute()
             )
+            self._favorites_cache[user_id] = response.data
             return response.data
         except Exception as e:
-            print(f"Error fetching favorites: {e}")
+            logger.warning("Error fetching favorites: %s", e)
             return []
 
 
-# Singleton instance
-_supabase_client: Optional[SupabaseClient] = None
+    async def count_user_favorites(self, user_id: str) -> int:
+        """Count a user's favorites without fetching them (SELECT COUNT(*))"""
+        response = await (
+            self.client.table("favorites")
+            .select("id", count=CountMethod.exact, head=True)
+            .eq("user_id", user_id)
+            .execute()
+        )
+        return response.count or 0
 
+    async def iter_user_favorites(
+        self, user_id: str, page_size: int = 100
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield a user's favorite artworks page by page
 
+        Uses keyset pagination on the primary key, so only one page is held
+        in memory and deep pages cost the same as the first.
+        """
+        last_id = None
+        while True:
+            query = (
+                self.client.table("favorites")
+                .select("*, artworks(*)")
+                .eq("user_id", user_id)
+            )
+            if last_id is not None:
+                query = query.gt("id", last_id)
+            response = await query.order("id").limit(page_size).execute()
+
+            for row in response.data:
+                yield row
+            if len(response.data) < page_size:
+                return
+            last_id = response.data[-1]["id"]
+
+
+@functools.cache
 def get_supabase_client() -> SupabaseClient:
     """Get or create Supabase client singleton"""
-    global _supabase_client
-    if _supabase_client is None:
-        _supabase_client = SupabaseClient()
-    return _supabase_client
-
+    return SupabaseClient()
@@ -4,15 +4,60 @@ Main application entry point
 """
 
 import os
+import atexit
+import asyncio
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 # Load environment variables FIRST (before importing routes)
 from dotenv import load_dotenv
 load_dotenv()
 
+
+def configure_logging():
+    """
+    Configure the root logger from LOG_LEVEL / LOG_FORMAT
+
+    LOG_FORMAT=json emits one JSON object per record (python-json-logger) so
+    log shippers can parse fields such as conversation_id directly.
+
+    Request handlers only enqueue records; a background listener thread does
+    the stream writes, so slow stdout/stderr never blocks the event loop.
+    """
+    handler = logging.StreamHandler()
+    if os.getenv("LOG_FORMAT", "text").lower() == "json":
+        from pythonjsonlogger import jsonlogger
+
+        handler.setFormatter(
+            jsonlogger.JsonFormatter("%(asctime)s %(levelname)s %(name)s %(message)s")
+        )
+    else:
+        handler.setFormatter(logging.Formatter("%(levelname)s %(name)s: %(message)s"))
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)  # flushes queued records on exit
+
+    # Message (and traceback) are rendered when enqueued; the listener's
+    # handler adds level/name or the JSON envelope
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    logging.basicConfig(
+        level=os.getenv("LOG_LEVEL", "INFO").upper(),
+        handlers=[queue_handler],
+        force=True,
+    )
+
+
+configure_logging()
+logger = logging.getLogger(__name__)
+
 # Now import routes (they will see the environment variables)
 from routes import room_analysis_router, recommendations_router, profile_router, chat_router
 
@@ -26,6 +71,14 @@ async def lifespan(app: FastAPI):
     print("🚀 Starting Art.Decor.AI Backend...")
     print(f"Environment: {os.getenv('ENVIRONMENT', 'development')}")
 
+    # FAISS searches and other blocking calls run on the default executor
+    # via asyncio.to_thread; size it to the machine instead of the stock cap
+    executor_workers = int(
+        os.getenv("DEFAULT_EXECUTOR_WORKERS", (os.cpu_count() or 1) * 2)
+    )
+    executor = ThreadPoolExecutor(max_workers=executor_workers)
+    asyncio.get_running_loop().set_default_executor(executor)
+
     # Initialize database connections
     try:
         from db.supabase_client import get_supabase_client
@@ -52,12 +105,27 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         print(f"⚠️  Warning: Agent initialization error: {e}")
 
+    # Warm trend/local catalog caches for common room styles in the background
+    from routes.recommendations import prewarm_caches
+
+    prewarm_task = asyncio.create_task(prewarm_caches())
+
     print("✨ Backend ready!")
 
     yield  # Application runs
 
     # Shutdown
     print("👋 Shutting down Art.Decor.AI Backend...")
+    prewarm_task.cancel()
+    from routes.room_analysis import decision_router
+
+    decision_router.vision_agent.close()
+    from db.supabase_client import get_supabase_client
+
+    if get_supabase_client.cache_info().currsize:
+        await get_supabase_client().close()
+
+    executor.shutdown(wait=False)
 
 
 # Create FastAPI app
@@ -68,6 +136,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,  # orjson encodes responses in C
 )
 
 # CORS Configuration
@@ -92,7 +161,7 @@ app.add_middleware(
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Global exception handler"""
-    print(f"❌ Unhandled error: {exc}")
+    logger.exception("Unhandled error: %s", exc, exc_info=exc)
     return JSONResponse(
         status_code=500,
         content={
@@ -167,10 +236,21 @@ app.include_router(recommendations_router)
 app.include_router(profile_router)
 app.include_router(chat_router)
 
-# Mount static files for local image storage
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles (HEAD, ETag/304 handling) with a one-day Cache-Control header"""
+
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        response.headers.setdefault("Cache-Control", "public, max-age=86400")
+        return response
+
+
+# Serve local image storage. In production set SERVE_UPLOADS=false and let the
+# reverse proxy serve /uploads directly (see README "Serving uploads").
 uploads_path = os.path.join(os.path.dirname(__file__), "uploads")
-if os.path.exists(uploads_path):
-    app.mount("/uploads", StaticFiles(directory=uploads_path), name="uploads")
+if os.path.exists(uploads_path) and os.getenv("SERVE_UPLOADS", "true").lower() == "true":
+    app.mount("/uploads", CachedStaticFiles(directory=uploads_path), name="uploads")
     print(f"✓ Serving static files from {uploads_path}")
 
 
@@ -3,7 +3,7 @@ Pydantic models for chat interactions
 """
 
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 
 
@@ -27,8 +27,7 @@ class ChatRequest(BaseModel):
     )
     user_id: Optional[str] = None
 
-    class Config:
-        extra = "allow"
+    model_config = ConfigDict(extra="allow")
 
 
 class ChatResponse(BaseModel):
@@ -2,8 +2,60 @@
 Recommendation request and response models
 """
 
-from typing import Optional, List
-from pydantic import BaseModel, Field, HttpUrl
+from typing import Annotated, Optional, List
+import numpy as np
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    HttpUrl,
+    PlainSerializer,
+    PlainValidator,
+    WithJsonSchema,
+)
+
+from utils.vectors import STYLE_VECTOR_DIM, decode_style_vector, encode_style_vector
+
+
+def _parse_style_vector(value) -> np.ndarray:
+    """
+    Decode a style vector straight into a unit-length float32 array
+
+    Normalizing once here lets FAISS searches skip query normalization.
+    """
+    try:
+        vector = decode_style_vector(value)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"invalid style_vector: {e}")
+    if vector.shape != (STYLE_VECTOR_DIM,):
+        raise ValueError(
+            f"style_vector must have {STYLE_VECTOR_DIM} dimensions, got shape {vector.shape}"
+        )
+    norm = float(np.linalg.norm(vector))
+    if norm > 0 and abs(norm - 1.0) > 1e-4:
+        vector = vector / norm  # new array; input may be shared or read-only
+    return vector
+
+
+# Parsed without building a Python float per dimension; serialized back to base64
+StyleVector = Annotated[
+    np.ndarray,
+    PlainValidator(_parse_style_vector),
+    PlainSerializer(encode_style_vector, return_type=str),
+    WithJsonSchema(
+        {
+            "anyOf": [
+                {"type": "string", "format": "base64"},
+                {
+                    "type": "array",
+                    "items": {"type": "number"},
+                    "minItems": STYLE_VECTOR_DIM,
+                    "maxItems": STYLE_VECTOR_DIM,
+                },
+            ]
+        }
+    ),
+]
 
 
 class ArtworkRecommendation(BaseModel):
@@ -36,7 +88,9 @@ class RecommendationRequest(BaseModel):
     """Request for décor recommendations"""
 
     # Primary fields from frontend
-    style_vector: List[float] = Field(..., description="512-dim style embedding from CLIP")
+    style_vector: StyleVector = Field(
+        ..., description="512-dim style embedding from CLIP (base64 float16 or list of floats)"
+    )
     user_style: Optional[str] = Field(None, description="Detected room style")
     color_preferences: Optional[List[str]] = Field(None, description="Preferred colors in hex")
     
@@ -55,8 +109,18 @@ class RecommendationRequest(BaseModel):
     limit: int = Field(default=3, ge=1, le=50, description="Number of recommendations")
     user_id: Optional[str] = None
     
-    class Config:
-        extra = "allow"  # Allow extra fields
+    model_config = ConfigDict(extra="allow")  # Allow extra fields
+
+
+class BatchRecommendationRequest(BaseModel):
+    """Several style vectors answered in one request"""
+
+    style_vectors: List[StyleVector] = Field(
+        ..., min_length=1, max_length=32, description="Style embeddings, one per room/query"
+    )
+    user_style: Optional[str] = Field(None, description="Detected room style")
+    color_preferences: Optional[List[str]] = Field(None, description="Preferred colors in hex")
+    limit: int = Field(default=3, ge=1, le=50, description="Recommendations per style vector")
 
 
 class RecommendationResponse(BaseModel):
@@ -3,7 +3,7 @@ Room analysis request and response models
 """
 
 from typing import Optional, List, Union, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ColorPalette(BaseModel):
@@ -51,6 +51,5 @@ class RoomAnalysisResponse(BaseModel):
     )
     processing_time: float = Field(..., description="Processing time in seconds")
     
-    class Config:
-        extra = "allow"  # Allow extra fields from VisionMatchAgent
+    model_config = ConfigDict(extra="allow")  # Allow extra fields from VisionMatchAgent
 
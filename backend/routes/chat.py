@@ -2,16 +2,39 @@
 Chat API routes for conversational décor recommendations
 """
 
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import Response
+import logging
+from fastapi import APIRouter, HTTPException, Request
 from typing import Dict, Any
+import re
 import time
-import os
+import numpy as np
 
-from models.chat import ChatRequest, ChatResponse, ChatMessage
+from models.chat import ChatRequest, ChatResponse
+from models.recommendation import RecommendationRequest
 from agents.chat_agent import get_chat_agent
+from routes.recommendations import get_recommendations as get_recs
+from utils.responses import MsgpackResponse, accepts_msgpack
 
 router = APIRouter(prefix="/api", tags=["chat"])
+logger = logging.getLogger(__name__)
+
+# Keywords that signal the user wants recommendations. Matched as plain
+# substrings in a single case-insensitive regex pass over the message.
+RECOMMENDATION_KEYWORDS = ["recommend", "show", "find", "suggest", "options", "artwork", "art", "pieces"]
+_RECOMMENDATION_INTENT = re.compile(
+    "|".join(map(re.escape, RECOMMENDATION_KEYWORDS)), re.IGNORECASE
+)
+
+# Recommendation fields included in chat responses
+CHAT_RECOMMENDATION_FIELDS = {
+    "id", "title", "artist", "price", "image_url", "thumbnail_url",
+    "match_score", "reasoning", "source", "purchase_url", "download_url",
+}
+
+# Neutral unit-length style vector used when no room analysis is available;
+# built once and shared (read-only) instead of a fresh random vector per request
+_DEFAULT_STYLE_VECTOR = np.full(512, 1 / np.sqrt(512), dtype=np.float32)
+_DEFAULT_STYLE_VECTOR.flags.writeable = False
 
 
 @router.post("/chat", response_model=ChatResponse)
@@ -32,7 +55,7 @@ async def chat(request: ChatRequest) -> ChatResponse:
     - Integration with recommendation engine
     """
     try:
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         # Get chat agent
         chat_agent = get_chat_agent()
@@ -46,15 +69,8 @@ async def chat(request: ChatRequest) -> ChatResponse:
         
         # Check if user is asking for recommendations
         recommendations = None
-        if any(
-            word in request.message.lower()
-            for word in ["recommend", "show", "find", "suggest", "options", "artwork", "art", "pieces"]
-        ):
+        if _RECOMMENDATION_INTENT.search(request.message):
             try:
-                # Import recommendation components
-                from models.recommendation import RecommendationRequest
-                import numpy as np
-                
                 # Get user style from context or message
                 user_style = "Modern"  # Default
                 colors = []
@@ -67,14 +83,12 @@ async def chat(request: ChatRequest) -> ChatResponse:
                     if "style_vector" in request.context:
                         style_vector = request.context["style_vector"]
                 
-                # If no style vector, create a default one
+                # If no style vector, use the shared default one
                 if not style_vector:
-                    # Generate a random style vector for demonstration
                     # In production, you'd want to generate this based on the message content
-                    style_vector = np.random.rand(512).tolist()
+                    style_vector = _DEFAULT_STYLE_VECTOR
                 
                 # Get recommendations
-                from routes.recommendations import get_recommendations as get_recs
                 rec_request = RecommendationRequest(
                     style_vector=style_vector,
                     user_style=user_style,
@@ -84,30 +98,18 @@ async def chat(request: ChatRequest) -> ChatResponse:
                 
                 rec_response = await get_recs(rec_request)
                 recommendations = [
-                    {
-                        "id": rec.id,
-                        "title": rec.title,
-                        "artist": rec.artist,
-                        "price": rec.price,
-                        "image_url": str(rec.image_url),
-                        "thumbnail_url": str(rec.thumbnail_url) if rec.thumbnail_url else None,
-                        "match_score": rec.match_score,
-                        "reasoning": rec.reasoning,
-                        "source": rec.source,
-                        "purchase_url": rec.purchase_url,
-                        "download_url": rec.download_url,
-                    }
+                    rec.model_dump(mode="json", include=CHAT_RECOMMENDATION_FIELDS)
                     for rec in rec_response.recommendations[:3]
                 ]
                 
-                print(f"✅ Generated {len(recommendations)} recommendations for chat")
+                logger.info("✅ Generated %s recommendations for chat", len(recommendations))
                 
             except Exception as e:
-                print(f"⚠️  Could not get recommendations: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.warning("⚠️  Could not get recommendations: %s", e)
+                # Traceback is only formatted when DEBUG logging is enabled
+                logger.debug("Chat recommendation failure", exc_info=True)
         
-        processing_time = time.time() - start_time
+        processing_time = time.perf_counter() - start_time
         
         return ChatResponse(
             message=response_text,
@@ -118,18 +120,20 @@ async def chat(request: ChatRequest) -> ChatResponse:
         )
     
     except Exception as e:
-        print(f"Chat error: {e}")
+        logger.exception("Chat error: %s", e)
         raise HTTPException(status_code=500, detail=f"Chat error: {str(e)}")
 
 
 @router.get("/chat/history/{conversation_id}")
-async def get_chat_history(conversation_id: str) -> Dict[str, Any]:
+async def get_chat_history(conversation_id: str, request: Request) -> Dict[str, Any]:
     """
     Retrieve conversation history
     
     **Returns:**
     - List of messages in conversation
     - Metadata (created_at, message count)
+
+    Send ``Accept: application/msgpack`` for a MessagePack body instead of JSON.
     """
     try:
         chat_agent = get_chat_agent()
@@ -138,16 +142,19 @@ async def get_chat_history(conversation_id: str) -> Dict[str, Any]:
         if not history:
             raise HTTPException(status_code=404, detail="Conversation not found")
         
-        return {
+        content = {
             "conversation_id": conversation_id,
             "messages": history,
             "message_count": len(history),
         }
+        if accepts_msgpack(request):
+            return MsgpackResponse(content)
+        return content
     
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Error retrieving history: {e}")
+        logger.exception("Error retrieving history: %s", e)
         raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
 
 
@@ -161,16 +168,14 @@ async def clear_chat_history(conversation_id: str) -> Dict[str, str]:
     try:
         chat_agent = get_chat_agent()
         
-        if conversation_id in chat_agent.conversations:
-            del chat_agent.conversations[conversation_id]
-            return {"status": "success", "message": "Conversation cleared"}
-        else:
+        if chat_agent.conversations.pop(conversation_id, None) is None:
             raise HTTPException(status_code=404, detail="Conversation not found")
+        return {"status": "success", "message": "Conversation cleared"}
     
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Error clearing history: {e}")
+        logger.exception("Error clearing history: %s", e)
         raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
 
 
@@ -184,7 +189,13 @@ async def submit_feedback(
     **Use case:** Improve AI quality over time
     """
     # In production, store feedback in database
-    print(f"Feedback received for {conversation_id}[{message_index}]: {feedback}")
+    logger.info(
+        "Feedback received for %s[%s]: %s",
+        conversation_id,
+        message_index,
+        feedback,
+        extra={"conversation_id": conversation_id, "message_index": message_index},
+    )
     
     return {
         "status": "success",
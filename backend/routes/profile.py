@@ -4,14 +4,18 @@ GET /profile - Get user profile
 POST /profile - Create/update user profile
 """
 
-from typing import Optional
-from fastapi import APIRouter, HTTPException
-from datetime import datetime
+import logging
+from typing import Optional, AsyncIterator
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from datetime import datetime, timezone
+import orjson
 
 from models.profile import UserProfile, ProfileRequest, ProfileResponse
 from db.supabase_client import get_supabase_client
 
 router = APIRouter(prefix="/api", tags=["User Profile"])
+logger = logging.getLogger(__name__)
 
 
 @router.get("/profile/{user_id}", response_model=ProfileResponse)
@@ -41,7 +45,7 @@ async def get_profile(user_id: str):
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Error fetching profile: {e}")
+        logger.exception("Error fetching profile: %s", e)
         raise HTTPException(status_code=500, detail=f"Error fetching profile: {str(e)}")
 
 
@@ -70,8 +74,9 @@ async def create_or_update_profile(
         # Check if profile exists
         existing_profile = await db.get_user_profile(user_id)
 
+        now_iso = datetime.now(timezone.utc).isoformat()
         profile_data = profile_request.model_dump(exclude_none=True)
-        profile_data["updated_at"] = datetime.utcnow().isoformat()
+        profile_data["updated_at"] = now_iso
 
         if existing_profile:
             # Update existing profile
@@ -80,7 +85,7 @@ async def create_or_update_profile(
         else:
             # Create new profile
             profile_data["id"] = user_id
-            profile_data["created_at"] = datetime.utcnow().isoformat()
+            profile_data["created_at"] = now_iso
             updated_data = await db.create_user_profile(profile_data)
             message = "Profile created successfully"
 
@@ -89,7 +94,7 @@ async def create_or_update_profile(
         return ProfileResponse(profile=profile, message=message)
 
     except Exception as e:
-        print(f"Error saving profile: {e}")
+        logger.exception("Error saving profile: %s", e)
         raise HTTPException(status_code=500, detail=f"Error saving profile: {str(e)}")
 
 
@@ -108,7 +113,7 @@ async def add_favorite(user_id: str, artwork_id: str):
         return {"message": "Artwork added to favorites", "favorite": result}
 
     except Exception as e:
-        print(f"Error adding favorite: {e}")
+        logger.exception("Error adding favorite: %s", e)
         raise HTTPException(
             status_code=500, detail=f"Error adding favorite: {str(e)}"
         )
@@ -134,28 +139,45 @@ async def remove_favorite(user_id: str, artwork_id: str):
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Error removing favorite: {e}")
+        logger.exception("Error removing favorite: %s", e)
         raise HTTPException(
             status_code=500, detail=f"Error removing favorite: {str(e)}"
         )
 
 
 @router.get("/profile/{user_id}/favorites")
-async def get_favorites(user_id: str):
+async def get_favorites(user_id: str, request: Request):
     """
     Get user's favorite artworks
 
     - **user_id**: User identifier
+
+    Clients sending ``Accept: application/x-ndjson`` get one favorite per
+    line, streamed page by page, with the total in ``X-Total-Count``.
     """
     try:
         db = get_supabase_client()
+
+        if "application/x-ndjson" in request.headers.get("accept", ""):
+            count = await db.count_user_favorites(user_id)
+            return StreamingResponse(
+                _ndjson(db.iter_user_favorites(user_id)),
+                media_type="application/x-ndjson",
+                headers={"X-Total-Count": str(count)},
+            )
+
         favorites = await db.get_user_favorites(user_id)
 
         return {"favorites": favorites, "count": len(favorites)}
 
     except Exception as e:
-        print(f"Error fetching favorites: {e}")
+        logger.exception("Error fetching favorites: %s", e)
         raise HTTPException(
             status_code=500, detail=f"Error fetching favorites: {str(e)}"
         )
 
+
+async def _ndjson(rows: AsyncIterator[dict]) -> AsyncIterator[bytes]:
+    """Encode rows as newline-delimited JSON"""
+    async for row in rows:
+        yield orjson.dumps(row) + b"\n"
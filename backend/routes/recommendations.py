@@ -3,16 +3,25 @@ Recommendations API routes
 POST /recommend - Get artwork recommendations
 """
 
+import logging
+import re
 import time
-import json
 import random
 import asyncio
+import functools
+import hashlib
+from collections import Counter, OrderedDict
+from cachetools import LRUCache, TTLCache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+import numpy as np
+import orjson
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from models.recommendation import (
+    BatchRecommendationRequest,
     RecommendationRequest,
     RecommendationResponse,
     ArtworkRecommendation,
@@ -20,138 +29,630 @@ from models.recommendation import (
 from db.faiss_client import get_faiss_client
 from db.supabase_client import get_supabase_client
 from agents.trend_intel_agent import TrendIntelAgent
-from agents.chat_agent import get_chat_agent
+from agents.chat_agent import FallbackReasoning, get_chat_agent
 from agents.store_inventory_agent import get_store_inventory_agent
 from agents.geo_finder_agent import GeoFinderAgent
 
-router = APIRouter(prefix="/api", tags=["Recommendations"])
+router = APIRouter(
+    prefix="/api",
+    tags=["Recommendations"],
+    default_response_class=ORJSONResponse,
+)
+logger = logging.getLogger(__name__)
 
 # Initialize agents
 trend_agent = TrendIntelAgent()
 chat_agent = get_chat_agent()
 store_agent = get_store_inventory_agent()
 geo_agent = GeoFinderAgent()
+faiss_client = get_faiss_client()
+
+# Reasoning and store searches only depend on their inputs, and
+# style/room/color combinations repeat heavily across users, so remote calls
+# (finished or in flight) are shared through small TTL'd LRU caches
+REASONING_CACHE_SIZE = 4096
+REASONING_CACHE_TTL = 3600  # seconds
+STORE_SEARCH_CACHE_SIZE = 1024
+STORE_SEARCH_CACHE_TTL = 600  # seconds; store listings and prices change
+_reasoning_cache: "OrderedDict[tuple, Tuple[float, asyncio.Future]]" = OrderedDict()
+_store_search_cache: "OrderedDict[tuple, Tuple[float, asyncio.Future]]" = OrderedDict()
+
+# Trends move over hours and the galleries around a spot over days; nearby
+# store searches are bucketed to ~100 m (3 decimal places of lat/lng)
+TRENDS_CACHE_SIZE = 1024
+TRENDS_CACHE_TTL = 3600  # seconds
+NEARBY_STORES_CACHE_SIZE = 8192
+NEARBY_STORES_CACHE_TTL = 86400  # seconds
+_trends_cache: "OrderedDict[tuple, Tuple[float, asyncio.Future]]" = OrderedDict()
+_nearby_stores_cache: "OrderedDict[tuple, Tuple[float, asyncio.Future]]" = OrderedDict()
+
+# Identical /recommend requests (same vector and fields) arriving together or
+# within a few seconds share one pipeline run and its response
+RECOMMENDATION_CACHE_SIZE = 256
+RECOMMENDATION_CACHE_TTL = 10  # seconds
+_recommendation_cache: "OrderedDict[tuple, Tuple[float, asyncio.Future]]" = OrderedDict()
+
+# Reasoning text mostly depends on styles, palette and score, not the title:
+# generated texts are kept as templates (title replaced by a placeholder) and
+# reused for other artworks with the same coarse context without an LLM call
+REASONING_TEMPLATE_CACHE_SIZE = 2048
+REASONING_TEMPLATE_TTL = 3600  # seconds
+_TITLE_PLACEHOLDER = "\x00title\x00"
+_reasoning_templates: TTLCache = TTLCache(
+    maxsize=REASONING_TEMPLATE_CACHE_SIZE, ttl=REASONING_TEMPLATE_TTL
+)
+
+# Cap on concurrent store searches per worker, so bursts of cache misses
+# queue here instead of fanning out into provider rate limits and timeouts
+# (LLM calls are capped inside the chat agent, see CHAT_CONCURRENCY)
+STORE_CONCURRENCY = 6
+_store_slots = asyncio.Semaphore(STORE_CONCURRENCY)
+
+
+async def _limited(slots: asyncio.Semaphore, make_call: Callable[[], Awaitable]):
+    """Run make_call() once a slot is free"""
+    async with slots:
+        return await make_call()
+
+
+def _shared_call(
+    cache: OrderedDict,
+    key: tuple,
+    make_call: Callable[[], Awaitable],
+    maxsize: int,
+    ttl: float,
+    keep: Optional[Callable[[Any], bool]] = None,
+) -> Awaitable:
+    """
+    Return a shared awaitable for key, starting make_call() on a miss
+
+    Entries expire after ttl seconds and the least recently used entry is
+    evicted past maxsize. Failed or cancelled calls, and results keep()
+    rejects, are dropped so the next request retries.
+    """
+    now = time.monotonic()
+    entry = cache.get(key)
+    if entry is not None and entry[0] > now:
+        cache.move_to_end(key)
+        future = entry[1]
+    else:
+        future = asyncio.ensure_future(make_call())
+        cache[key] = (now + ttl, future)
+        cache.move_to_end(key)
+        if len(cache) > maxsize:
+            cache.popitem(last=False)
+
+        def _drop_failed(done: asyncio.Future):
+            if (
+                done.cancelled()
+                or done.exception() is not None
+                or (keep is not None and not keep(done.result()))
+            ):
+                entry = cache.get(key)
+                if entry is not None and entry[1] is done:
+                    del cache[key]
+
+        future.add_done_callback(_drop_failed)
+
+    # Shield so one cancelled request does not cancel the shared call
+    return asyncio.shield(future)
+
+
+def _reasoning_spec(
+    artwork_title: str,
+    artwork_style: str,
+    room_style: Optional[str] = None,
+    colors: Optional[List[str]] = None,
+    match_score: float = 0.0,
+    artwork_tags: Optional[List[str]] = None,
+) -> Tuple[tuple, dict]:
+    """
+    Normalize generate_reasoning arguments into (cache key, call kwargs)
+
+    Colors are sorted, tags treated as a set and the match score bucketed to
+    the nearest 5 so near-identical requests share one cache entry.
+    """
+    colors = sorted(colors or [])
+    match_score = float(round(match_score / 5) * 5)
+    key = (
+        artwork_title,
+        artwork_style,
+        room_style,
+        tuple(colors),
+        match_score,
+        frozenset(artwork_tags or []),
+    )
+    spec = {
+        "artwork_title": artwork_title,
+        "artwork_style": artwork_style,
+        "room_style": room_style,
+        "colors": colors,
+        "match_score": match_score,
+        "artwork_tags": artwork_tags,
+    }
+    return key, spec
+
+
+def _color_bucket(color: str) -> str:
+    """Coarse color key: hex colors quantized to 4 levels per channel"""
+    color = color.strip().lower()
+    if len(color) == 7 and color.startswith("#"):
+        try:
+            return "".join(str(int(color[i:i + 2], 16) >> 6) for i in (1, 3, 5))
+        except ValueError:
+            pass
+    return color
+
+
+def _template_key(spec: dict) -> tuple:
+    """Coarse reasoning context shared by artworks that can reuse a template"""
+    colors = spec["colors"]
+    return (
+        (spec["room_style"] or "").lower(),
+        spec["artwork_style"].lower(),
+        _color_bucket(colors[0]) if colors else "",
+        round(spec["match_score"], -1),
+    )
+
+
+def _template_reasoning(spec: dict) -> Optional[str]:
+    """Fill a cached reasoning template for spec's artwork, if one exists"""
+    template = _reasoning_templates.get(_template_key(spec))
+    if template is None:
+        return None
+    return template.replace(_TITLE_PLACEHOLDER, spec["artwork_title"])
+
+
+def _generated(reasoning: str) -> bool:
+    """True for LLM-written reasoning, False for the agent's fallback template"""
+    return not isinstance(reasoning, FallbackReasoning)
+
+
+async def _remember_template(spec: dict, call: Awaitable[str]) -> str:
+    """Await a generated reasoning and store it as a template for spec's context"""
+    reasoning = await call
+    if not _generated(reasoning):
+        # Fallback text quotes this artwork's own score, and templating it
+        # would spread one failed call to every artwork in the context
+        return reasoning
+    title = spec["artwork_title"]
+    _reasoning_templates[_template_key(spec)] = (
+        reasoning.replace(title, _TITLE_PLACEHOLDER) if title else reasoning
+    )
+    return reasoning
+
+
+def _completed(value) -> asyncio.Future:
+    """An already-resolved future, for cache hits that need no call"""
+    future = asyncio.get_running_loop().create_future()
+    future.set_result(value)
+    return future
+
+
+async def _coalesced_reasoning(spec: dict) -> str:
+    """One artwork's reasoning, batched with other requests' concurrent misses"""
+    return (await chat_agent.generate_reasoning_coalesced([spec]))[0]
+
+
+def _cached_reasoning(**kwargs) -> Awaitable[str]:
+    """LRU/template-cached chat_agent.generate_reasoning (see _reasoning_spec)"""
+    key, spec = _reasoning_spec(**kwargs)
+    reasoning = _template_reasoning(spec)
+    if reasoning is not None:
+        return _completed(reasoning)
+    return _shared_call(
+        _reasoning_cache,
+        key,
+        lambda: _remember_template(spec, _coalesced_reasoning(spec)),
+        REASONING_CACHE_SIZE,
+        REASONING_CACHE_TTL,
+        # Fallback text from an LLM outage is not kept for the full TTL
+        keep=_generated,
+    )
+
+
+def _cached_reasoning_batch(items: List[dict]) -> List[Awaitable[str]]:
+    """
+    LRU/template-cached reasoning for several artworks at once
+
+    Cache misses are generated together by one
+    chat_agent.generate_reasoning_coalesced call (one LLM round-trip, shared
+    with other requests' misses in the same window); each LLM-written
+    result is then cached individually like _cached_reasoning's.
+
+    Args:
+        items: generate_reasoning() keyword arguments, one dict per artwork
+
+    Returns:
+        One awaitable reasoning per item, in order
+    """
+    specs = [_reasoning_spec(**item) for item in items]
+    templated = [_template_reasoning(spec) for _, spec in specs]
+
+    now = time.monotonic()
+    missing: "OrderedDict[tuple, dict]" = OrderedDict()
+    for (key, spec), reasoning in zip(specs, templated):
+        if reasoning is not None:
+            continue
+        entry = _reasoning_cache.get(key)
+        if (entry is None or entry[0] <= now) and key not in missing:
+            missing[key] = spec
+
+    batch = None
+    if missing:
+        batch = asyncio.ensure_future(
+            chat_agent.generate_reasoning_coalesced(list(missing.values()))
+        )
+    positions = {key: position for position, key in enumerate(missing)}
+
+    async def _from_batch(position: int) -> str:
+        return (await batch)[position]
+
+    return [
+        _completed(reasoning) if reasoning is not None else _shared_call(
+            _reasoning_cache,
+            key,
+            # Keys evicted since the miss scan fall back to a single call
+            lambda key=key, spec=spec: _remember_template(
+                spec,
+                _from_batch(positions[key]) if key in positions
+                else _coalesced_reasoning(spec),
+            ),
+            REASONING_CACHE_SIZE,
+            REASONING_CACHE_TTL,
+            keep=_generated,
+        )
+        for (key, spec), reasoning in zip(specs, templated)
+    ]
+
+
+def _cached_store_search(
+    query: str,
+    style: Optional[str] = None,
+    color: Optional[str] = None,
+    limit: int = 10,
+) -> Awaitable[List[dict]]:
+    """
+    TTL/LRU-cached store_agent.search_artwork
+
+    Results are shared between requests and must not be mutated.
+    """
+    return _shared_call(
+        _store_search_cache,
+        (query, style, color, limit),
+        lambda: _limited(
+            _store_slots,
+            lambda: store_agent.search_artwork(
+                query=query, style=style, color=color, limit=limit
+            ),
+        ),
+        STORE_SEARCH_CACHE_SIZE,
+        STORE_SEARCH_CACHE_TTL,
+    )
+
+
+def _cached_trending_styles(location: Optional[str] = None) -> Awaitable[List[dict]]:
+    """TTL/LRU-cached trend_agent.get_trending_styles (shared, do not mutate)"""
+    return _shared_call(
+        _trends_cache,
+        ((location or "").strip().lower(),),
+        lambda: trend_agent.get_trending_styles(location=location),
+        TRENDS_CACHE_SIZE,
+        TRENDS_CACHE_TTL,
+    )
+
+
+def _cached_nearby_stores(
+    latitude: float,
+    longitude: float,
+    radius: int = 10000,
+    store_type: str = "art_gallery",
+) -> Awaitable[List[dict]]:
+    """
+    TTL/LRU-cached geo_agent.find_nearby_stores (shared, do not mutate)
+
+    The search runs from the bucketed location, so every caller in a
+    bucket gets the same stores and distances.
+    """
+    latitude, longitude = round(float(latitude), 3), round(float(longitude), 3)
+    return _shared_call(
+        _nearby_stores_cache,
+        (latitude, longitude, radius, store_type),
+        lambda: geo_agent.find_nearby_stores(
+            latitude=latitude,
+            longitude=longitude,
+            radius=radius,
+            store_type=store_type,
+        ),
+        NEARBY_STORES_CACHE_SIZE,
+        NEARBY_STORES_CACHE_TTL,
+    )
+
+
+def _match_scores(similarities: np.ndarray) -> List[float]:
+    """
+    Convert FAISS similarities to 0-100 match scores in one vectorized pass
+
+    Inner product of unit vectors is cosine similarity; negative and
+    slightly-above-1 (fp16 rounding) values are clipped. No per-hit
+    divide (as in 1/(1+d) for L2 distances) is needed.
+    """
+    scores = np.clip(np.asarray(similarities, dtype=np.float32), 0.0, 1.0)
+    scores *= 100  # in place on the clipped copy
+    return scores.tolist()
+
+
+# Validates a whole list of row dicts in one pydantic-core call
+_REC_LIST_ADAPTER = TypeAdapter(List[ArtworkRecommendation])
+
+
+def _validate_rows(rows: List[dict]) -> List[ArtworkRecommendation]:
+    """
+    Validate rows in one batch, dropping individual invalid rows
+
+    The batch call is the fast path; only when it fails are rows
+    re-validated one by one so a single bad store listing is skipped.
+    """
+    try:
+        return _REC_LIST_ADAPTER.validate_python(rows)
+    except ValidationError:
+        valid = []
+        for row in rows:
+            try:
+                valid.append(ArtworkRecommendation.model_validate(row))
+            except ValidationError as e:
+                logger.warning("⚠️  Dropping invalid recommendation %s: %s", row.get("id"), e)
+        return valid
+
+
+# Unsplash photo ids: /photos/<slug>-PHOTOID or /photo-<timestamp>-PHOTOID?...
+_UNSPLASH_SLUG_ID = re.compile(r'/photo[s]?/[^/]*-([A-Za-z0-9_-]+)')
+_UNSPLASH_TIMESTAMP_ID = re.compile(r'/photo-\d+-([A-Za-z0-9_-]+)\?')
+
+
+def _extract_photo_id(url: Optional[str]) -> Optional[str]:
+    """Extract unique photo ID from image URL (handles Unsplash IDs, etc.)"""
+    if not url:
+        return url
+    # For Unsplash: extract photo ID (e.g., tTEYELCR8OA from the URL)
+    if 'unsplash.com' in url:
+        match = _UNSPLASH_SLUG_ID.search(url) or _UNSPLASH_TIMESTAMP_ID.search(url)
+        if match:
+            return match.group(1)
+    # For other URLs, use the base URL without query params
+    return url.split('?', 1)[0]
+
 
 # Load local catalog
 LOCAL_CATALOG = []
 LOCAL_CATALOG_PATH = Path(__file__).parent.parent / "data" / "local_catalog.json"
 
+# Local catalog items validated once at load; handlers model_copy() them with
+# the per-request reasoning/score instead of re-validating every field
+_LOCAL_RECOMMENDATIONS: Dict[str, ArtworkRecommendation] = {}
+
+# Lowercased title/description/tags of each LOCAL_CATALOG item (same order),
+# built at load so keyword scoring does no joins or lower() per request
+_LOCAL_CATALOG_TEXT: List[str] = []
+
+# Image identifier (see _extract_photo_id) of each local catalog item by id,
+# used to drop online results that duplicate a local pick
+_LOCAL_PHOTO_IDS: Dict[str, Optional[str]] = {}
+
+# Keyword matches per (lowercased style, limit); the ranking only depends on
+# the catalog, so it is memoized until the next load. Styles with no match
+# are not stored, so their random picks stay random.
+_LOCAL_MATCHES: LRUCache = LRUCache(maxsize=1024)
+
+# Room styles the vision agent reports plus the handler default; their trends
+# and local catalog matches are warmed at startup (see prewarm_caches)
+PREWARM_STYLES = (
+    "Modern", "Modern Minimalist", "Minimalist", "Contemporary", "Bohemian",
+    "Traditional", "Industrial", "Scandinavian", "Mid-Century Modern",
+    "Coastal", "Rustic", "Abstract",
+)
+
+
+def _local_catalog_row(item: dict) -> dict:
+    """Request-independent recommendation fields of a local catalog item"""
+    return {
+        "id": item['id'],
+        "title": item['title'],
+        "artist": item['artist'],
+        "price": item['price'],
+        "image_url": item['image_url'],
+        "thumbnail_url": item['thumbnail_url'],
+        "style": item['category'].replace('_', ' ').title(),
+        "tags": item['tags'],
+        "dimensions": f"{item['width']}x{item['height']}",
+        "match_score": 0.0,
+        "reasoning": "",
+        "download_url": item['download_url'],
+        "source": "Local Catalog",
+        "purchase_options": [],
+        "print_on_demand": [{
+            'service': ps['name'],
+            'url': ps['url'],
+            'price': ps['price_from']
+        } for ps in item['print_services']],
+        "attribution": {
+            'text': item['attribution'],
+            'url': item['attribution_url']
+        },
+    }
+
+
+def _local_catalog_text(item: dict) -> str:
+    """Searchable text of a local catalog item"""
+    return f"{item['title']} {item['description']} {' '.join(item['tags'])}".lower()
+
+
+def _local_recommendation(item: dict, **update) -> Optional[ArtworkRecommendation]:
+    """Copy of a pre-validated local catalog recommendation with update applied"""
+    base = _LOCAL_RECOMMENDATIONS.get(item['id'])
+    return base.model_copy(update=update) if base is not None else None
+
+
 def load_local_catalog():
     """Load local catalog from JSON file"""
-    global LOCAL_CATALOG
+    global LOCAL_CATALOG, _LOCAL_CATALOG_TEXT
     if LOCAL_CATALOG_PATH.exists():
-        with open(LOCAL_CATALOG_PATH, 'r') as f:
-            LOCAL_CATALOG = json.load(f)
-            print(f"✅ Loaded {len(LOCAL_CATALOG)} items from local catalog")
+        LOCAL_CATALOG = orjson.loads(LOCAL_CATALOG_PATH.read_bytes())
+        logger.info("✅ Loaded %s items from local catalog", len(LOCAL_CATALOG))
+        _LOCAL_CATALOG_TEXT = [_local_catalog_text(item) for item in LOCAL_CATALOG]
+        _LOCAL_PHOTO_IDS.clear()
+        _LOCAL_PHOTO_IDS.update(
+            (item['id'], _extract_photo_id(item['image_url'])) for item in LOCAL_CATALOG
+        )
+        _LOCAL_MATCHES.clear()
+        _LOCAL_RECOMMENDATIONS.clear()
+        _LOCAL_RECOMMENDATIONS.update(
+            (rec.id, rec)
+            for rec in _validate_rows([_local_catalog_row(item) for item in LOCAL_CATALOG])
+        )
     else:
-        print("⚠️  Local catalog not found. Run scripts/build_catalog.py first.")
+        logger.warning("⚠️  Local catalog not found. Run scripts/build_catalog.py first.")
 
 # Load catalog on module import
 load_local_catalog()
 
 
-async def _process_artwork_recommendation(
-    idx: int,
-    artwork_meta: dict,
-    match_score: float,
-    request: RecommendationRequest,
-):
+# Fallbacks for artwork metadata fields missing from FAISS/store results
+_DEFAULT_TITLE = 'Untitled'
+_DEFAULT_ARTIST = 'Unknown Artist'
+_DEFAULT_IMAGE = 'https://via.placeholder.com/400'
+_DEFAULT_DIMENSIONS = 'Standard'
+_DEFAULT_STYLE = 'Contemporary'
+
+# Defaults merged under a FAISS hit's metadata so each row reads it once;
+# sequence defaults are tuples so rows never share a mutable list
+_ARTWORK_DEFAULTS = {
+    'id': 'unknown',
+    'title': _DEFAULT_TITLE,
+    'artist': _DEFAULT_ARTIST,
+    'price': 0,
+    'image_url': _DEFAULT_IMAGE,
+    'thumbnail_url': None,
+    'tags': (),
+    'stores': (),
+    'dimensions': _DEFAULT_DIMENSIONS,
+    'medium': None,
+    'style': _DEFAULT_STYLE,
+}
+
+# Store query suffixes for FAISS hits without tags, rotated by hit position
+SEARCH_VARIATIONS = ('wall art', 'canvas print', 'framed art', 'poster print')
+
+
+@functools.lru_cache(maxsize=4096)
+def _build_query(idx: int, style: str, tags: tuple) -> str:
+    """Store search text for the hit at position idx (pure, so memoized)"""
+    if len(tags) > idx:
+        return f"{style} {tags[idx]} wall art"
+    if tags:
+        return f"{style} {tags[0]} art print"
+    return f"{style} {SEARCH_VARIATIONS[idx % len(SEARCH_VARIATIONS)]}"
+
+
+def _store_query(idx: int, artwork_meta: dict) -> Tuple[str, str]:
+    """Build the (query, style) store search for a FAISS hit from its metadata"""
+    style = artwork_meta.get('style', 'modern')
+    tags = artwork_meta.get('tags') or ()
+    return _build_query(idx, style, tuple(tags)), style
+
+
+async def _fetch_store_items(search_query: str, style: str, limit: int) -> List[dict]:
     """
-    Process a single artwork recommendation in parallel
-    Fetches store data and generates AI reasoning
-    """
-    # Initialize with FAISS metadata
-    title = artwork_meta.get('title', 'Untitled')
-    artist = artwork_meta.get('artist', 'Unknown Artist')
-    price = f"${artwork_meta.get('price', 0)}"
-    image_url = artwork_meta.get('image_url', 'https://via.placeholder.com/400')
-    thumbnail_url = artwork_meta.get('thumbnail_url')
-    purchase_url = None
-    download_url = None
-    source = "Local Catalog"
-    purchase_options = []
-    print_on_demand = []
-    
-    # Fetch real store data with timeout protection
+    Look up real store listings for a store query
+
+    Returns an empty list on timeout/failure/no match.
+    """
+    logger.debug("🔍 Store search: %s", search_query)
     try:
-        # Build search query from FAISS metadata
-        style = artwork_meta.get('style', 'modern')
-        tags = artwork_meta.get('tags', [])
-        
-        if tags and len(tags) > idx:
-            search_query = f"{style} {tags[idx]} wall art"
-        elif tags:
-            search_query = f"{style} {tags[0]} art print"
-        else:
-            variations = ['wall art', 'canvas print', 'framed art', 'poster print']
-            search_query = f"{style} {variations[idx % len(variations)]}"
-        
-        print(f"🔍 Search #{idx+1}: {search_query}")
-        
-        # Fetch real store data (async - runs in parallel with timeout!)
-        store_results = await asyncio.wait_for(
-            store_agent.search_artwork(
-                query=search_query,
-                style=style,
-                limit=1  # Only need 1 result per recommendation for speed
-            ),
+        return await asyncio.wait_for(
+            _cached_store_search(query=search_query, style=style, limit=limit),
             timeout=3.0  # Max 3 seconds per search
         )
-        
-        # Use first result if available
-        if store_results:
-            real_item = store_results[0]
-            title = real_item.get('title', title)
-            artist = real_item.get('artist', artist)
-            price = real_item.get('price', price)
-            image_url = real_item.get('image_url', image_url)
-            thumbnail_url = real_item.get('thumbnail_url', thumbnail_url)
-            purchase_url = real_item.get('purchase_url')
-            download_url = real_item.get('download_url')
-            source = real_item.get('source')
-            purchase_options = real_item.get('purchase_options', [])
-            print_on_demand = real_item.get('print_on_demand', [])
-            print(f"✅ Replaced with real store item: '{title}' from {source}")
     
     except asyncio.TimeoutError:
-        print(f"⏱️  Store search timed out for item {idx} (>3s)")
+        logger.warning("⏱️  Store search timed out for '%s' (>3s)", search_query)
     except Exception as e:
-        print(f"⚠️  Store search failed for item {idx}: {e}")
-    
-    # Generate AI reasoning (async - runs in parallel!)
+        logger.warning("⚠️  Store search failed for '%s': %s", search_query, e)
+    return []
+
+
+def _pick_store_item(store_results: List[dict], start: int, used_ids: set) -> Optional[dict]:
+    """
+    Round-robin pick from store results, skipping items already used
+
+    Returns None once every result for the query has been handed out, so
+    the hit keeps its own FAISS metadata instead of repeating an item.
+    """
+    count = len(store_results)
+    for offset in range(count):
+        item = store_results[(start + offset) % count]
+        item_id = item.get('id')
+        if item_id is None or item_id not in used_ids:
+            if item_id is not None:
+                used_ids.add(item_id)
+            return item
+    return None
+
+
+async def _artwork_reasoning(
+    idx: int,
+    row: dict,
+    pending: Awaitable[str],
+) -> str:
+    """Await AI reasoning for a FAISS hit row, falling back to a template"""
     try:
-        reasoning = await chat_agent.generate_reasoning(
-            artwork_title=artwork_meta.get('title', 'Untitled'),
-            artwork_style=artwork_meta.get('style', 'Contemporary'),
-            room_style=request.user_style or request.room_style,
-            colors=request.color_preferences or request.colors,
-            match_score=match_score,
-            artwork_tags=artwork_meta.get('tags', [])
-        )
+        return await pending
     except Exception as e:
-        print(f"⚠️  LLM reasoning failed for item {idx}: {e}")
-        reasoning = f"This {artwork_meta.get('style', 'Contemporary').lower()} piece matches your room's aesthetic with a {match_score:.0f}% compatibility score."
-    
-    return ArtworkRecommendation(
-        id=artwork_meta.get('id', 'unknown'),
-        title=title,
-        artist=artist,
-        price=price,
-        image_url=image_url,
-        thumbnail_url=thumbnail_url,
-        match_score=match_score,
-        tags=artwork_meta.get('tags', []),
-        reasoning=reasoning,
-        stores=artwork_meta.get('stores', []),
-        dimensions=artwork_meta.get('dimensions', 'Standard'),
-        medium=artwork_meta.get('medium'),
-        style=artwork_meta.get('style', 'Contemporary'),
-        purchase_url=purchase_url,
-        download_url=download_url,
-        source=source,
-        purchase_options=purchase_options,
-        print_on_demand=print_on_demand
-    )
+        logger.warning("⚠️  LLM reasoning failed for item %s: %s", idx, e)
+        return f"This {row['style'].lower()} piece matches your room's aesthetic with a {row['match_score']:.0f}% compatibility score."
+
+
+def _recommendation_row(artwork_meta: dict, match_score: float) -> dict:
+    """
+    Recommendation fields for a FAISS hit, read from its metadata once
+
+    reasoning is filled in later and _apply_store_item() may override the
+    listing fields.
+    """
+    meta = {**_ARTWORK_DEFAULTS, **artwork_meta}
+    return {
+        "id": meta['id'],
+        "title": meta['title'],
+        "artist": meta['artist'],
+        "price": f"${meta['price']}",
+        "image_url": meta['image_url'],
+        "thumbnail_url": meta['thumbnail_url'],
+        "match_score": match_score,
+        "tags": meta['tags'],
+        "reasoning": "",
+        "stores": meta['stores'],
+        "dimensions": meta['dimensions'],
+        "medium": meta['medium'],
+        "style": meta['style'],
+        "purchase_url": None,
+        "download_url": None,
+        "source": "Local Catalog",
+        "purchase_options": [],
+        "print_on_demand": [],
+    }
+
+
+def _apply_store_item(row: dict, store_item: dict) -> None:
+    """Replace a row's listing fields with a real store listing"""
+    for key in ("title", "artist", "price", "image_url", "thumbnail_url"):
+        row[key] = store_item.get(key, row[key])
+    get = store_item.get
+    row["purchase_url"] = get('purchase_url')
+    row["download_url"] = get('download_url')
+    row["source"] = get('source')
+    row["purchase_options"] = get('purchase_options', [])
+    row["print_on_demand"] = get('print_on_demand', [])
+    logger.debug("✅ Replaced with real store item: '%s' from %s", row["title"], row["source"])
 
 
 def get_local_catalog_recommendations(style: str, limit: int = 3) -> list:
@@ -162,19 +663,18 @@ def get_local_catalog_recommendations(style: str, limit: int = 3) -> list:
     if not LOCAL_CATALOG:
         return []
     
+    key = (style.lower(), limit)
+    matches = _LOCAL_MATCHES.get(key)
+    if matches is not None:
+        return list(matches)
+    
     # Simple keyword matching for now
-    style_keywords = style.lower().split()
+    style_keywords = key[0].split()
     
     # Score each item based on keyword matches
     scored_items = []
-    for item in LOCAL_CATALOG:
-        score = 0
-        item_text = f"{item['title']} {item['description']} {' '.join(item['tags'])}".lower()
-        
-        for keyword in style_keywords:
-            if keyword in item_text:
-                score += 1
-        
+    for item, item_text in zip(LOCAL_CATALOG, _LOCAL_CATALOG_TEXT):
+        score = sum(keyword in item_text for keyword in style_keywords)
         if score > 0:
             scored_items.append((score, item))
     
@@ -183,12 +683,37 @@ def get_local_catalog_recommendations(style: str, limit: int = 3) -> list:
     
     # If we have scored items, return them
     if scored_items:
-        return [item for score, item in scored_items[:limit]]
+        matches = [item for score, item in scored_items[:limit]]
+        _LOCAL_MATCHES[key] = matches
+        return list(matches)
     
     # Otherwise return random selection
     return random.sample(LOCAL_CATALOG, min(limit, len(LOCAL_CATALOG)))
 
 
+async def prewarm_caches():
+    """
+    Keep trends and local catalog matches for PREWARM_STYLES warm
+
+    Runs for the app's lifetime (started from the lifespan hook); each
+    round starts just after the previous round's trend entries expired.
+    """
+    for style in PREWARM_STYLES:
+        get_local_catalog_recommendations(style, limit=2)
+    if trend_agent.client is None:
+        return  # Trends API not configured; every lookup fails fast anyway
+
+    while True:
+        results = await asyncio.gather(
+            _cached_trending_styles(),
+            *[_cached_trending_styles(style) for style in PREWARM_STYLES],
+            return_exceptions=True,
+        )
+        failed = sum(isinstance(result, Exception) for result in results)
+        logger.info("🔥 Prewarmed trends for %s styles (%s failed)", len(results) - failed, failed)
+        await asyncio.sleep(TRENDS_CACHE_TTL + 1)
+
+
 @router.post("/nearby-stores")
 async def get_nearby_stores(
     latitude: float,
@@ -209,7 +734,7 @@ async def get_nearby_stores(
         List of nearby stores with details
     """
     try:
-        stores = await geo_agent.find_nearby_stores(
+        stores = await _cached_nearby_stores(
             latitude=latitude,
             longitude=longitude,
             radius=radius,
@@ -223,7 +748,7 @@ async def get_nearby_stores(
             "radius_km": radius / 1000
         }
     except Exception as e:
-        print(f"Error finding nearby stores: {e}")
+        logger.exception("Error finding nearby stores: %s", e)
         raise HTTPException(status_code=500, detail=f"Error finding stores: {str(e)}")
 
 
@@ -258,7 +783,7 @@ async def get_store_directions(
             "destination": {"lat": dest_lat, "lng": dest_lng}
         }
     except Exception as e:
-        print(f"Error getting directions: {e}")
+        logger.exception("Error getting directions: %s", e)
         raise HTTPException(status_code=500, detail=f"Error getting directions: {str(e)}")
 
 
@@ -272,123 +797,87 @@ async def get_fast_recommendations(request: RecommendationRequest):
     try:
         start_time = time.time()
         
-        # Query FAISS vector database for similar artworks
-        faiss_client = get_faiss_client()
-        recommendations = []
-        
-        if request.style_vector and len(request.style_vector) > 0:
-            try:
-                import numpy as np
-                style_vector = np.array(request.style_vector, dtype=np.float32)
-                distances, results = faiss_client.search(style_vector, k=request.limit)
-                
-                if results:
-                    for idx, (dist, artwork_meta) in enumerate(zip(distances, results)):
-                        similarity = 1.0 / (1.0 + dist)
-                        match_score = similarity * 100
-                        
-                        # Simple template reasoning (fast, no LLM call)
-                        reasoning = f"This {artwork_meta.get('style', 'contemporary').lower()} piece matches your room's aesthetic with a {match_score:.0f}% compatibility score."
-                        
-                        recommendations.append(ArtworkRecommendation(
-                            id=artwork_meta.get('id', 'unknown'),
-                            title=artwork_meta.get('title', 'Untitled'),
-                            artist=artwork_meta.get('artist', 'Unknown Artist'),
-                            price=f"${artwork_meta.get('price', 0)}",
-                            image_url=artwork_meta.get('image_url', 'https://via.placeholder.com/400'),
-                            thumbnail_url=artwork_meta.get('thumbnail_url'),
-                            match_score=match_score,
-                            tags=artwork_meta.get('tags', []),
-                            reasoning=reasoning,
-                            stores=[],
-                            dimensions=artwork_meta.get('dimensions', 'Standard'),
-                            medium=artwork_meta.get('medium'),
-                            style=artwork_meta.get('style', 'Contemporary'),
-                            purchase_url=None,
-                            download_url=None,
-                            source="FAISS Database",
-                            purchase_options=[],
-                            print_on_demand=[]
-                        ))
-            except Exception as e:
-                print(f"FAISS search error: {e}")
-        
-        # Add local catalog items first
+        # Local catalog items (template reasoning, no LLM call)
         room_style = request.user_style or request.room_style or "Modern"
         local_items = get_local_catalog_recommendations(room_style, limit=2)
-        
-        # Track image identifiers to avoid duplicates (extract photo ID from URL)
-        def extract_photo_id(url):
-            """Extract unique photo ID from image URL (handles Unsplash IDs, etc.)"""
-            if not url:
-                return url
-            # For Unsplash: extract photo ID (e.g., tTEYELCR8OA from the URL)
-            if 'unsplash.com' in url:
-                import re
-                # Match pattern like /photo-...-PHOTOID or /photos/PHOTOID
-                match = re.search(r'/photo[s]?/[^/]*-([A-Za-z0-9_-]+)', url)
-                if not match:
-                    match = re.search(r'/photo-\d+-([A-Za-z0-9_-]+)\?', url)
-                if match:
-                    return match.group(1)
-            # For other URLs, use the base URL without query params
-            return url.split('?')[0]
-        
-        seen_photo_ids = set()
-        seen_photo_ids.update([extract_photo_id(item['image_url']) for item in local_items])
-        
+        local_recommendations = []
         for item in local_items:
             reasoning = f"Expertly curated {item['category'].replace('_', ' ')} artwork that perfectly complements your {room_style.lower()} aesthetic. High-quality print available for instant download."
-            recommendations.append(ArtworkRecommendation(
-                id=item['id'],
-                title=item['title'],
-                artist=item['artist'],
-                price=item['price'],
-                image_url=item['image_url'],
-                thumbnail_url=item['thumbnail_url'],
-                style=item['category'].replace('_', ' ').title(),
-                tags=item['tags'],
-                dimensions=f"{item['width']}x{item['height']}",
+            recommendation = _local_recommendation(
+                item,
                 match_score=92.0,  # High score for curated items (was 85)
                 reasoning=reasoning,
-                download_url=item['download_url'],
-                source="Local Catalog",
-                purchase_options=[],
-                print_on_demand=[{
-                    'service': ps['name'],
-                    'url': ps['url'],
-                    'price': ps['price_from']
-                } for ps in item['print_services']],
-                attribution={
-                    'text': item['attribution'],
-                    'url': item['attribution_url']
-                }
-            ))
+            )
+            if recommendation is not None:
+                local_recommendations.append(recommendation)
         
-        # Add 1-2 online store results for variety (after local to avoid duplicates)
-        try:
-            # Quick search for 3 online results with aggressive timeout (we'll filter duplicates)
-            online_results = await asyncio.wait_for(
-                store_agent.search_artwork(
+        # Online results rank after anything scoring >= online_score, so the
+        # search is skipped when such items already fill the limit. Otherwise
+        # it starts now to run alongside the FAISS search (2 s from here).
+        online_score = 88.0  # Slightly lower than local catalog
+        online_task = None
+        if len(local_recommendations) < request.limit:
+            online_task = asyncio.ensure_future(asyncio.wait_for(
+                _cached_store_search(
                     query=f"{room_style} wall art decor",
                     style=room_style,
                     limit=3
                 ),
                 timeout=2.0  # Max 2 seconds for online search
+            ))
+        
+        # Query FAISS vector database for similar artworks
+        recommendations = []
+        
+        try:
+            # style_vector is unit length (normalized during validation)
+            distances, results = await faiss_client.asearch(
+                request.style_vector, k=request.limit, assume_normalized=True
             )
+                
+            rows = []
+            for match_score, artwork_meta in zip(_match_scores(distances), results):
+                row = _recommendation_row(artwork_meta, match_score)
+                    
+                # Simple template reasoning (fast, no LLM call)
+                row["reasoning"] = f"This {row['style'].lower()} piece matches your room's aesthetic with a {match_score:.0f}% compatibility score."
+                row["stores"] = []
+                row["source"] = "FAISS Database"
+                rows.append(row)
+            recommendations.extend(_REC_LIST_ADAPTER.validate_python(rows))
+        except Exception as e:
+            logger.exception("FAISS search error: %s", e)
+        
+        # Add local catalog items first
+        recommendations.extend(local_recommendations)
+        
+        # Track image identifiers to avoid duplicates
+        seen_photo_ids = {_LOCAL_PHOTO_IDS[item['id']] for item in local_items}
+        
+        if online_task is not None and sum(
+            rec.match_score >= online_score for rec in recommendations
+        ) >= request.limit:
+            # Only this request's wait is cancelled; the shared search keeps warming the cache
+            online_task.cancel()
+            online_task = None
+        
+        # Add 1-2 online store results for variety (after local to avoid duplicates)
+        try:
+            # Quick search for 3 online results (we'll filter duplicates)
+            online_results = await online_task if online_task is not None else []
             
             online_added = 0
             for online_item in online_results:
                 image_url = online_item.get('image_url', '')
                 
                 # Skip if no valid image URL
-                if not image_url or image_url == 'https://via.placeholder.com/400':
+                if not image_url or image_url == _DEFAULT_IMAGE:
                     continue
                 
                 # Extract photo ID and check for duplicates
-                photo_id = extract_photo_id(image_url)
+                photo_id = _extract_photo_id(image_url)
                 if photo_id in seen_photo_ids:
-                    print(f"⚠️  Skipping duplicate image (ID: {photo_id}): {online_item.get('title', 'Unknown')}")
+                    logger.warning("⚠️  Skipping duplicate image (ID: %s): %s", photo_id, online_item.get('title', 'Unknown'))
                     continue
                 
                 seen_photo_ids.add(photo_id)
@@ -399,7 +888,7 @@ async def get_fast_recommendations(request: RecommendationRequest):
                     price=online_item.get('price', 'Price varies'),
                     image_url=image_url,
                     thumbnail_url=online_item.get('thumbnail_url'),
-                    match_score=88.0,  # Slightly lower than local catalog
+                    match_score=online_score,
                     tags=online_item.get('tags', []),
                     reasoning="",  # Empty for skeleton loader
                     stores=[],
@@ -415,19 +904,20 @@ async def get_fast_recommendations(request: RecommendationRequest):
                 if online_added >= 2:
                     break
             
-            print(f"✅ Added {online_added} unique online results (filtered {len(online_results) - online_added} duplicates)")
+            logger.debug("✅ Added %s unique online results (filtered %s duplicates)", online_added, len(online_results) - online_added)
         except asyncio.TimeoutError:
-            print(f"⏱️  Online search timed out (>2s), skipping")
+            logger.warning("⏱️  Online search timed out (>2s), skipping")
         except Exception as e:
-            print(f"⚠️  Online search failed: {e}, continuing with local only")
+            logger.warning("⚠️  Online search failed: %s, continuing with local only", e)
         
         # Sort by match score (highest first)
         recommendations.sort(key=lambda x: x.match_score, reverse=True)
         
         query_time = time.time() - start_time
-        print(f"⚡ Fast recommendations returned in {query_time:.2f}s with {len(recommendations)} items")
+        logger.info("⚡ Fast recommendations returned in %.2fs with %s items", query_time, len(recommendations))
         
-        return RecommendationResponse(
+        # Items are already validated; skip a second pass over the response
+        return RecommendationResponse.model_construct(
             recommendations=recommendations[:request.limit],
             total_matches=len(recommendations),
             query_time=query_time,
@@ -435,12 +925,110 @@ async def get_fast_recommendations(request: RecommendationRequest):
         )
     
     except Exception as e:
-        print(f"Error in fast recommendations: {e}")
+        logger.exception("Error in fast recommendations: %s", e)
         raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
 
 
+async def _top_trend_styles(room_style: Optional[str], limit: int = 5) -> List[str]:
+    """Names of the top trending styles, or [] if the trends API fails"""
+    try:
+        trends = await _cached_trending_styles(room_style)
+    except Exception as e:
+        logger.warning("⚠️  Trends API failed: %s", e)
+        return []
+    return [trend["style"] for trend in trends[:limit]]
+
+
+async def _recommendations_from_hits(
+    distances: np.ndarray,
+    results: List[dict],
+    room_style: Optional[str],
+    colors: Optional[List[str]],
+    limit: int,
+) -> List[ArtworkRecommendation]:
+    """
+    Turn FAISS hits into recommendations with store listings and reasoning
+
+    Store lookups and the batched reasoning call run concurrently.
+    """
+    if not results:
+        return []
+    logger.debug("⚡ Processing %s recommendations in PARALLEL for speed...", len(results))
+
+    # Each hit's metadata is read once into its row
+    rows = [
+        _recommendation_row(meta, score)
+        for score, meta in zip(_match_scores(distances), results)
+    ]
+
+    # Hits sharing style/tags produce the same store query; each
+    # distinct query is searched once and its results are dealt
+    # out round-robin so those hits get distinct store items
+    store_queries = [
+        _store_query(idx, meta) for idx, meta in enumerate(results)
+    ]
+    unique_queries = list(dict.fromkeys(store_queries))
+    store_limit = min(3, limit)
+
+    # Reasoning for all hits is one batched LLM call; it and the
+    # store lookups are independent, so they all run in one gather
+    logger.debug("⏱️  Starting parallel execution of %s tasks...", len(unique_queries) + 1)
+    parallel_start = time.time()
+    pending_reasonings = _cached_reasoning_batch([
+        {
+            "artwork_title": row["title"],
+            "artwork_style": row["style"],
+            "room_style": room_style,
+            "colors": colors,
+            "match_score": row["match_score"],
+            "artwork_tags": row["tags"],
+        }
+        for row in rows
+    ])
+    gathered = await asyncio.gather(
+        *[
+            _fetch_store_items(query, style, store_limit)
+            for query, style in unique_queries
+        ],
+        *[
+            _artwork_reasoning(idx, row, pending)
+            for idx, (row, pending) in enumerate(zip(rows, pending_reasonings))
+        ],
+    )
+    parallel_time = time.time() - parallel_start
+    store_by_query = dict(zip(unique_queries, gathered[:len(unique_queries)]))
+    reasonings = gathered[len(unique_queries):]
+    used_ids = set()
+    picks = Counter()
+    store_items = []
+    for query in store_queries:
+        store_items.append(
+            _pick_store_item(store_by_query[query], picks[query], used_ids)
+        )
+        picks[query] += 1
+
+    for row, store_item, reasoning in zip(rows, store_items, reasonings):
+        row["reasoning"] = reasoning
+        if store_item:
+            _apply_store_item(row, store_item)
+    recommendations = _validate_rows(rows)
+    logger.debug("✅ Parallel processing complete in %.2fs (was ~%.1fs sequential)", parallel_time, len(rows)*3)
+    return recommendations
+
+
+def _request_key(request: RecommendationRequest) -> tuple:
+    """Digest of a recommendation request: its style vector bytes plus other fields"""
+    digest = hashlib.blake2b(request.style_vector.tobytes(), digest_size=16)
+    digest.update(orjson.dumps(
+        request.model_dump(exclude={"style_vector"}),
+        option=orjson.OPT_SORT_KEYS,
+        default=str,
+    ))
+    return (digest.digest(),)
+
+
 @router.post("/recommend", response_model=RecommendationResponse)
-async def get_recommendations(request: RecommendationRequest):
+async def get_recommendations(request: RecommendationRequest) -> RecommendationResponse:
     """
     Get personalized décor recommendations based on room analysis
 
@@ -456,67 +1044,69 @@ async def get_recommendations(request: RecommendationRequest):
     - AI reasoning for each recommendation
     - Local store availability
     - Current trending styles
+
+    Identical requests within RECOMMENDATION_CACHE_TTL seconds (including
+    concurrent ones) share one computation and response.
     """
+    return await _shared_call(
+        _recommendation_cache,
+        _request_key(request),
+        lambda: _compute_recommendations(request),
+        RECOMMENDATION_CACHE_SIZE,
+        RECOMMENDATION_CACHE_TTL,
+    )
+
+
+async def _compute_recommendations(request: RecommendationRequest) -> RecommendationResponse:
+    """Run the full FAISS/store/LLM pipeline for get_recommendations"""
     try:
         start_time = time.time()
 
-        # Get trending styles for context (pass room style for more relevant results)
-        room_style = request.user_style or request.room_style
-        try:
-            trends = await trend_agent.get_trending_styles(location=room_style)
-        except Exception as e:
-            print(f"⚠️  Trends API failed: {e}")
-            trends = []
+        # Get trending styles for context (pass room style for more relevant
+        # results); nothing below depends on them, so fetch in the background
+        trends_task = asyncio.create_task(
+            _top_trend_styles(request.user_style or request.room_style)
+        )
+
+        # Local catalog picks only depend on the room style: select them and
+        # start their reasoning now so it overlaps the FAISS/store/LLM stage
+        room_style = request.user_style or request.room_style or "Modern"
+        local_items = get_local_catalog_recommendations(room_style, limit=2)
+        local_reasonings = asyncio.gather(
+            *_cached_reasoning_batch([
+                {
+                    "artwork_title": item['title'],
+                    "artwork_style": item['category'].replace('_', ' ').title(),
+                    "room_style": room_style,
+                    "match_score": 85.0,  # High match for curated items
+                }
+                for item in local_items
+            ]),
+            return_exceptions=True,
+        )
 
         # Query FAISS vector database for similar artworks using style_vector
-        faiss_client = get_faiss_client()
         recommendations = []
 
-        # Try FAISS search if style_vector is provided
-        if request.style_vector and len(request.style_vector) > 0:
-            try:
-                import numpy as np
-                
-                style_vector = np.array(request.style_vector, dtype=np.float32)
-                
-                # Search FAISS for similar artworks
-                distances, results = faiss_client.search(style_vector, k=request.limit)
+        try:
+            # Search FAISS for similar artworks (style_vector was normalized during validation)
+            distances, results = await faiss_client.asearch(
+                request.style_vector, k=request.limit, assume_normalized=True
+            )
                 
-                # Convert FAISS results to recommendations using PARALLEL processing
-                if results:
-                    print(f"⚡ Processing {len(results)} recommendations in PARALLEL for speed...")
-                    
-                    # Create tasks for parallel execution
-                    tasks = []
-                    for idx, (dist, artwork_meta) in enumerate(zip(distances, results)):
-                        similarity = 1.0 / (1.0 + dist)
-                        match_score = similarity * 100
-                        
-                        # Create async task (don't await yet - will run in parallel!)
-                        task = _process_artwork_recommendation(
-                            idx=idx,
-                            artwork_meta=artwork_meta,
-                            match_score=match_score,
-                            request=request
-                        )
-                        tasks.append(task)
-                    
-                    # Execute ALL tasks in parallel (10x faster!)
-                    print(f"⏱️  Starting parallel execution of {len(tasks)} tasks...")
-                    parallel_start = time.time()
-                    recommendations = await asyncio.gather(*tasks, return_exceptions=True)
-                    parallel_time = time.time() - parallel_start
-                    
-                    # Filter out any exceptions
-                    recommendations = [r for r in recommendations if isinstance(r, ArtworkRecommendation)]
-                    print(f"✅ Parallel processing complete in {parallel_time:.2f}s (was ~{len(tasks)*3:.1f}s sequential)")
+            recommendations = await _recommendations_from_hits(
+                distances,
+                results,
+                request.user_style or request.room_style,
+                request.color_preferences or request.colors,
+                request.limit,
+            )
                         
-            except Exception as e:
-                print(f"FAISS search error: {e}, falling back to mock data")
+        except Exception as e:
+            logger.exception("FAISS search error: %s, falling back to mock data", e)
 
         # Fall back to mock recommendations if FAISS is empty or failed
         if not recommendations:
-            room_style = request.user_style or request.room_style or "Modern"
             colors = request.color_preferences or request.colors or []
             mock_recommendations = await _get_mock_recommendations(
                 room_style, colors, request.limit
@@ -528,65 +1118,38 @@ async def get_recommendations(request: RecommendationRequest):
         # ==================================================================
         # Strategy: Keep 1-2 online recommendations, add 2 local catalog items
         # This ensures users see both local and online options
-        room_style = request.user_style or request.room_style or "Modern"
         
         # Keep only 1 online recommendation if we have any
         online_recommendations = recommendations[:1] if recommendations else []
         local_catalog_recommendations = []
         
-        # Get 2 local catalog items
-        local_items = get_local_catalog_recommendations(room_style, limit=2)
-        
+        # 2 local catalog items, with the reasoning started above
+        reasonings = await local_reasonings
         if local_items:
-            print(f"📁 Adding {len(local_items)} local catalog recommendations")
-            for item in local_items:
-                # Generate AI reasoning for local catalog items
-                try:
-                    reasoning = await chat_agent.generate_reasoning(
-                        artwork_title=item['title'],
-                        artwork_style=item['category'].replace('_', ' ').title(),
-                        room_style=room_style,
-                        match_score=85.0  # High match for curated items
-                    )
-                except Exception as e:
-                    print(f"⚠️  LLM reasoning failed for local item: {e}")
+            logger.debug("📁 Adding %s local catalog recommendations", len(local_items))
+            for item, reasoning in zip(local_items, reasonings):
+                if isinstance(reasoning, Exception):
+                    logger.warning("⚠️  LLM reasoning failed for local item: %s", reasoning)
                     reasoning = f"This curated {item['category'].replace('_', ' ')} piece is expertly selected to complement your {room_style.lower()} style with 85% compatibility."
                 
-                local_catalog_recommendations.append(ArtworkRecommendation(
-                    id=item['id'],
-                    title=item['title'],
-                    artist=item['artist'],
-                    price=item['price'],
-                    image_url=item['image_url'],
-                    thumbnail_url=item['thumbnail_url'],
-                    style=item['category'].replace('_', ' ').title(),
-                    tags=item['tags'],
-                    dimensions=f"{item['width']}x{item['height']}",
+                recommendation = _local_recommendation(
+                    item,
                     match_score=85.0,
                     reasoning=reasoning,
-                    download_url=item['download_url'],
                     source="📁 Local Catalog",  # Clear indicator
-                    purchase_options=[],
-                    print_on_demand=[{
-                        'service': ps['name'],
-                        'url': ps['url'],
-                        'price': ps['price_from']
-                    } for ps in item['print_services']],
-                    attribution={
-                        'text': item['attribution'],
-                        'url': item['attribution_url']
-                    }
-                ))
+                )
+                if recommendation is not None:
+                    local_catalog_recommendations.append(recommendation)
         
         # Combine: 2 local + 1 online
         recommendations = local_catalog_recommendations + online_recommendations
-        print(f"📊 Final mix: {len(local_catalog_recommendations)} local + {len(online_recommendations)} online")
+        logger.debug("📊 Final mix: %s local + %s online", len(local_catalog_recommendations), len(online_recommendations))
 
         # Add nearby stores if user location provided
         if request.user_location and request.user_location.get('latitude') and request.user_location.get('longitude'):
             try:
-                print(f"🗺️  Finding nearby art stores for location: {request.user_location}")
-                nearby_stores = await geo_agent.find_nearby_stores(
+                logger.debug("🗺️  Finding nearby art stores for location: %s", request.user_location)
+                nearby_stores = await _cached_nearby_stores(
                     latitude=request.user_location['latitude'],
                     longitude=request.user_location['longitude'],
                     radius=request.user_location.get('radius', 10000),  # Default 10km
@@ -595,7 +1158,7 @@ async def get_recommendations(request: RecommendationRequest):
                 
                 # Add nearby stores to each recommendation
                 if nearby_stores:
-                    print(f"✅ Found {len(nearby_stores)} nearby stores")
+                    logger.debug("✅ Found %s nearby stores", len(nearby_stores))
                     for rec in recommendations:
                         # Format stores for response
                         rec.stores = [
@@ -613,22 +1176,97 @@ async def get_recommendations(request: RecommendationRequest):
                             for store in nearby_stores[:5]  # Top 5 closest stores
                         ]
                 else:
-                    print("ℹ️  No nearby stores found")
+                    logger.debug("ℹ️  No nearby stores found")
             except Exception as e:
-                print(f"⚠️  Error finding nearby stores: {e}")
+                logger.warning("⚠️  Error finding nearby stores: %s", e)
                 # Continue without local stores
 
         query_time = time.time() - start_time
 
-        return RecommendationResponse(
+        # Items are already validated; skip a second pass over the response
+        return RecommendationResponse.model_construct(
             recommendations=recommendations,
             total_matches=len(recommendations),
             query_time=query_time,
-            trends=[trend["style"] for trend in trends[:5]],  # Show top 5 trends
+            trends=await trends_task,
         )
 
     except Exception as e:
-        print(f"Error in recommendations: {e}")
+        logger.exception("Error in recommendations: %s", e)
+        raise HTTPException(
+            status_code=500, detail=f"Error generating recommendations: {str(e)}"
+        )
+
+
+@router.post("/recommend/batch", response_model=List[RecommendationResponse])
+async def get_batch_recommendations(request: BatchRecommendationRequest):
+    """
+    Recommendations for several style vectors in one round trip
+
+    - **style_vectors**: Style embeddings (e.g. one per analyzed room)
+    - **limit**: Recommendations per style vector
+
+    All vectors are searched with a single FAISS call; the store and
+    reasoning fan-outs for every vector then run concurrently. Responses
+    come back in the order of ``style_vectors`` and share one trends lookup.
+    """
+    try:
+        start_time = time.time()
+        trends_task = asyncio.create_task(_top_trend_styles(request.user_style))
+
+        # One (n, d) matrix product instead of n separate searches
+        distances, results = await asyncio.to_thread(
+            faiss_client.search_batch,
+            np.stack(request.style_vectors),
+            request.limit,
+            True,  # style vectors were normalized during validation
+        )
+
+        async def query_recommendations(query_distances, query_results):
+            try:
+                return await _recommendations_from_hits(
+                    query_distances,
+                    query_results,
+                    request.user_style,
+                    request.color_preferences,
+                    request.limit,
+                )
+            except Exception as e:
+                logger.warning("⚠️  Batch query failed, using mock data: %s", e)
+                return []
+
+        per_query = await asyncio.gather(*[
+            query_recommendations(query_distances, query_results)
+            for query_distances, query_results in zip(distances, results)
+        ])
+
+        fallback = None
+        responses = []
+        for recommendations in per_query:
+            if not recommendations:
+                if fallback is None:
+                    fallback = await _get_mock_recommendations(
+                        request.user_style or "Modern",
+                        request.color_preferences or [],
+                        request.limit,
+                    )
+                recommendations = fallback
+            responses.append(recommendations)
+
+        query_time = time.time() - start_time
+        trends = await trends_task
+        return [
+            RecommendationResponse.model_construct(
+                recommendations=recommendations,
+                total_matches=len(recommendations),
+                query_time=query_time,
+                trends=trends,
+            )
+            for recommendations in responses
+        ]
+
+    except Exception as e:
+        logger.exception("Error in batch recommendations: %s", e)
         raise HTTPException(
             status_code=500, detail=f"Error generating recommendations: {str(e)}"
         )
@@ -658,34 +1296,38 @@ async def enrich_recommendations_with_reasoning(request: EnrichReasoningRequest)
         artworks = request.artworks
         room_style = request.room_style
         colors = request.colors
-        # Generate reasoning for all artworks in parallel
-        async def generate_single_reasoning(artwork):
+        # Generate reasoning for all artworks with one batched LLM call
+        pending_reasonings = _cached_reasoning_batch([
+            {
+                "artwork_title": artwork.get('title', _DEFAULT_TITLE),
+                "artwork_style": artwork.get('style', _DEFAULT_STYLE),
+                "room_style": room_style,
+                "colors": colors,
+                "match_score": artwork.get('match_score', 90.0),
+                "artwork_tags": artwork.get('tags', []),
+            }
+            for artwork in artworks
+        ])
+
+        async def generate_single_reasoning(artwork, pending):
             try:
-                reasoning = await chat_agent.generate_reasoning(
-                    artwork_title=artwork.get('title', 'Untitled'),
-                    artwork_style=artwork.get('style', 'Contemporary'),
-                    room_style=room_style,
-                    colors=colors,
-                    match_score=artwork.get('match_score', 90.0),
-                    artwork_tags=artwork.get('tags', [])
-                )
+                reasoning = await pending
                 return {
                     "artwork_id": artwork.get('id'),
                     "reasoning": reasoning
                 }
             except Exception as e:
-                print(f"Error generating reasoning for {artwork.get('id')}: {e}")
+                logger.exception("Error generating reasoning for %s: %s", artwork.get('id'), e)
                 return {
                     "artwork_id": artwork.get('id'),
                     "reasoning": f"This {artwork.get('style', 'contemporary').lower()} piece complements your {room_style.lower()} room beautifully."
                 }
         
-        # Process all artworks in parallel
-        tasks = [generate_single_reasoning(artwork) for artwork in artworks]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Filter out exceptions
-        enriched = [r for r in results if isinstance(r, dict)]
+        # Process all artworks in parallel; failures already fall back per artwork
+        enriched = await asyncio.gather(*[
+            generate_single_reasoning(artwork, pending)
+            for artwork, pending in zip(artworks, pending_reasonings)
+        ])
         
         return {
             "enriched_count": len(enriched),
@@ -693,7 +1335,7 @@ async def enrich_recommendations_with_reasoning(request: EnrichReasoningRequest)
         }
     
     except Exception as e:
-        print(f"Error in batch reasoning generation: {e}")
+        logger.exception("Error in batch reasoning generation: %s", e)
         raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
 
 
@@ -711,7 +1353,7 @@ async def generate_artwork_reasoning(
     Use this to enrich recommendations with LLM-powered explanations
     """
     try:
-        reasoning = await chat_agent.generate_reasoning(
+        reasoning = await _cached_reasoning(
             artwork_title=artwork_title,
             artwork_style=artwork_style,
             room_style=room_style,
@@ -725,7 +1367,7 @@ async def generate_artwork_reasoning(
             "reasoning": reasoning
         }
     except Exception as e:
-        print(f"Error generating reasoning: {e}")
+        logger.exception("Error generating reasoning: %s", e)
         return {
             "artwork_id": artwork_id,
             "reasoning": f"This {artwork_style.lower()} piece matches your {room_style.lower()} room perfectly."
@@ -740,15 +1382,18 @@ async def get_trending_recommendations(limit: int = 10):
     - **limit**: Number of trending items to return
     """
     try:
-        trends = await trend_agent.get_trending_styles()
+        trends, seasonal = await asyncio.gather(
+            _cached_trending_styles(),
+            trend_agent.get_seasonal_recommendations(),
+        )
 
         return {
             "trending_styles": trends,
-            "seasonal": await trend_agent.get_seasonal_recommendations(),
+            "seasonal": seasonal,
         }
 
     except Exception as e:
-        print(f"Error fetching trends: {e}")
+        logger.exception("Error fetching trends: %s", e)
         raise HTTPException(status_code=500, detail=f"Error fetching trends: {str(e)}")
 
 
@@ -761,66 +1406,71 @@ async def _get_mock_recommendations(
     """
     try:
         # Search for real artwork from online stores
-        print(f"🔍 Searching real stores for {style} artwork...")
+        logger.debug("🔍 Searching real stores for %s artwork...", style)
         
-        store_results = await store_agent.search_artwork(
+        store_results = await _cached_store_search(
             query=f"{style} wall art",
             style=style,
             color=colors[0] if colors else None,
             limit=limit
         )
+        # Store agents may return more than asked for; trim before any
+        # reasoning is requested so no LLM work is spent on dropped items
+        store_results = store_results[:limit]
+        
+        logger.debug("✅ Found %s real artworks!", len(store_results))
         
-        print(f"✅ Found {len(store_results)} real artworks!")
+        # Calculate decreasing match scores
+        match_scores = [95.0 - (idx * 3) for idx in range(len(store_results))]
+        
+        # Generate AI reasoning for all results with one batched LLM call
+        reasonings = await asyncio.gather(*_cached_reasoning_batch([
+            {
+                "artwork_title": item["title"],
+                "artwork_style": item.get("tags", [style])[0] if item.get("tags") else style,
+                "room_style": style,
+                "colors": colors,
+                "match_score": match_score,
+                "artwork_tags": item.get("tags", []),
+            }
+            for item, match_score in zip(store_results, match_scores)
+        ]))
         
         # Convert store results to recommendations with AI reasoning
-        recommendations = []
-        for idx, item in enumerate(store_results):
-            # Calculate decreasing match score
-            match_score = 95.0 - (idx * 3)
-            
-            # Generate AI reasoning
-            reasoning = await chat_agent.generate_reasoning(
-                artwork_title=item["title"],
-                artwork_style=item.get("tags", [style])[0] if item.get("tags") else style,
-                room_style=style,
-                colors=colors,
-                match_score=match_score,
-                artwork_tags=item.get("tags", [])
-            )
-            
+        rows = []
+        for item, match_score, reasoning in zip(store_results, match_scores, reasonings):
             # Create recommendation with real store data
-            recommendations.append(ArtworkRecommendation(
-                id=item["id"],
-                title=item["title"],
-                artist=item["artist"],
-                price=item["price"],
-                image_url=item["image_url"],
-                thumbnail_url=item.get("thumbnail_url", item["image_url"]),
-                match_score=match_score,
-                tags=item.get("tags", [style]),
-                reasoning=reasoning,
-                stores=[{
+            rows.append({
+                "id": item["id"],
+                "title": item["title"],
+                "artist": item["artist"],
+                "price": item["price"],
+                "image_url": item["image_url"],
+                "thumbnail_url": item.get("thumbnail_url", item["image_url"]),
+                "match_score": match_score,
+                "tags": item.get("tags", [style]),
+                "reasoning": reasoning,
+                "stores": [{
                     "name": item["source"],
                     "url": item.get("purchase_url", ""),
                     "distance": "Online"
                 }],
-                dimensions=item.get("dimensions", "Multiple sizes available"),
-                medium=item.get("materials", ["Canvas"])[0] if item.get("materials") else "Canvas",
-                style=item.get("tags", [style])[0] if item.get("tags") else style,
+                "dimensions": item.get("dimensions", "Multiple sizes available"),
+                "medium": item.get("materials", ["Canvas"])[0] if item.get("materials") else "Canvas",
+                "style": item.get("tags", [style])[0] if item.get("tags") else style,
                 # Real store integration fields
-                purchase_url=item.get("purchase_url"),
-                download_url=item.get("download_url"),
-                source=item.get("source"),
-                purchase_options=item.get("purchase_options", []),
-                print_on_demand=item.get("print_on_demand", []),
-                attribution=item.get("attribution")
-            ))
+                "purchase_url": item.get("purchase_url"),
+                "download_url": item.get("download_url"),
+                "source": item.get("source"),
+                "purchase_options": item.get("purchase_options", []),
+                "print_on_demand": item.get("print_on_demand", []),
+                "attribution": item.get("attribution"),
+            })
         
-        return recommendations
+        return _REC_LIST_ADAPTER.validate_python(rows)
         
     except Exception as e:
-        print(f"❌ Error fetching real store data: {e}")
-        print("   Falling back to static mock data...")
+        logger.exception("❌ Error fetching real store data: %s; falling back to static mock data", e)
         
         # Fallback to static data if store agent fails
         mock_data_raw = [
@@ -868,18 +1518,21 @@ async def _get_mock_recommendations(
             },
         ]
         
-        recommendations = []
-        for item in mock_data_raw[:limit]:
-            reasoning = await chat_agent.generate_reasoning(
-                artwork_title=item["title"],
-                artwork_style=item["style"],
-                room_style=style,
-                colors=colors,
-                match_score=item["match_score"],
-                artwork_tags=item["tags"]
-            )
-            item["reasoning"] = reasoning
-            recommendations.append(ArtworkRecommendation(**item))
+        mock_items = mock_data_raw[:limit]
+        reasonings = await asyncio.gather(*_cached_reasoning_batch([
+            {
+                "artwork_title": item["title"],
+                "artwork_style": item["style"],
+                "room_style": style,
+                "colors": colors,
+                "match_score": item["match_score"],
+                "artwork_tags": item["tags"],
+            }
+            for item in mock_items
+        ]))
         
-        return recommendations
+        return _REC_LIST_ADAPTER.validate_python([
+            {**item, "reasoning": reasoning}
+            for item, reasoning in zip(mock_items, reasonings)
+        ])
 
@@ -3,6 +3,8 @@ Room analysis API routes
 POST /analyze_room - Upload and analyze room image
 """
 
+import asyncio
+import logging
 import io
 import time
 from typing import Optional
@@ -13,10 +15,26 @@ from models.room_analysis import RoomAnalysisResponse
 from agents.decision_router import DecisionRouter
 
 router = APIRouter(prefix="/api", tags=["Room Analysis"])
+logger = logging.getLogger(__name__)
 
 # Initialize decision router (orchestrates all agents)
 decision_router = DecisionRouter()
 
+# Longest side uploads are decoded to; YOLO and CLIP resize to <=640/224 anyway
+ANALYSIS_IMAGE_SIZE = 1024
+
+
+def _decode_room_image(image_data: bytes, target: int = ANALYSIS_IMAGE_SIZE) -> Image.Image:
+    """Decode an upload to an RGB image no larger than ``target`` on either side"""
+    img = Image.open(io.BytesIO(image_data))
+    # JPEGs decode at 1/2, 1/4 or 1/8 scale via libjpeg's scaled IDCT
+    img.draft("RGB", (target, target))
+    img.load()
+    if img.mode != "RGB":
+        img = img.convert("RGB")
+    img.thumbnail((target, target), Image.BILINEAR)
+    return img
+
 
 @router.post("/analyze_room", response_model=RoomAnalysisResponse)
 async def analyze_room(
@@ -43,13 +61,9 @@ async def analyze_room(
         if not image.content_type.startswith("image/"):
             raise HTTPException(status_code=400, detail="File must be an image")
 
-        # Read and open image
+        # Read the upload and decode it off the event loop
         image_data = await image.read()
-        pil_image = Image.open(io.BytesIO(image_data))
-
-        # Convert to RGB if necessary
-        if pil_image.mode != "RGB":
-            pil_image = pil_image.convert("RGB")
+        pil_image = await asyncio.to_thread(_decode_room_image, image_data)
 
         # Analyze room using VisionMatchAgent
         start_time = time.time()
@@ -66,7 +80,7 @@ async def analyze_room(
         return RoomAnalysisResponse(**analysis)
 
     except Exception as e:
-        print(f"Error in room analysis: {e}")
+        logger.exception("Error in room analysis: %s", e)
         raise HTTPException(status_code=500, detail=f"Error analyzing room: {str(e)}")
 
 
@@ -87,7 +101,7 @@ async def get_analysis_history(user_id: str, limit: int = 10):
         return {"analyses": analyses, "count": len(analyses)}
 
     except Exception as e:
-        print(f"Error fetching analysis history: {e}")
+        logger.exception("Error fetching analysis history: %s", e)
         raise HTTPException(
             status_code=500, detail=f"Error fetching history: {str(e)}"
         )
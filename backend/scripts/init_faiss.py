@@ -10,6 +10,9 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import numpy as np
+from dotenv import load_dotenv
+load_dotenv()
+
 from db.faiss_client import get_faiss_client
 
 
@@ -51,12 +54,14 @@ def init_faiss_index():
         # Test search
         print()
         print("Testing vector search...")
-        query_vector = np.random.randn(512).astype(np.float32)
-        distances, results = faiss.search(query_vector, k=3)
+        # Exercise the batched path the API uses: one [B, 512] matrix, one FAISS call
+        query_vectors = np.random.randn(4, 512).astype(np.float32)
+        batch_distances, batch_results = faiss.search_batch(query_vectors, k=3)
+        distances, results = batch_distances[0], batch_results[0]
         
-        print(f"✓ Search returned {len(results)} results")
+        print(f"✓ Batched search over {len(batch_results)} queries returned {len(results)} results each")
         for i, (dist, meta) in enumerate(zip(distances, results), 1):
-            print(f"  {i}. {meta.get('title', 'Unknown')} (distance: {dist:.4f})")
+            print(f"  {i}. {meta.get('title', 'Unknown')} (similarity: {dist:.4f})")
         
         print()
         print("=" * 60)
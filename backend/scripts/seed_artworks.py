@@ -16,6 +16,9 @@ import requests
 from io import BytesIO
 from datetime import datetime
 
+from dotenv import load_dotenv
+load_dotenv()
+
 from db.supabase_client import get_supabase_client
 from db.faiss_client import get_faiss_client
 from utils.file_storage import get_file_storage
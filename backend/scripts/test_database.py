@@ -13,6 +13,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 import numpy as np
 from PIL import Image, ImageDraw
 
+from dotenv import load_dotenv
+load_dotenv()
+
 from db.supabase_client import get_supabase_client
 from db.faiss_client import get_faiss_client
 from utils.file_storage import get_file_storage
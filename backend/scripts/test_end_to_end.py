@@ -21,6 +21,7 @@ from agents.vision_match_agent import VisionMatchAgent
 from agents.trend_intel_agent import TrendIntelAgent
 from agents.geo_finder_agent import GeoFinderAgent
 from db.faiss_client import FAISSClient
+from utils.vectors import decode_style_vector
 
 async def test_end_to_end():
     """Complete end-to-end test of the Art.Decor.AI system"""
@@ -120,7 +121,7 @@ async def test_end_to_end():
         ]
         
         # Generate mock embeddings (in production, these would be pre-generated)
-        style_vector = np.array(analysis['style_vector'])
+        style_vector = decode_style_vector(analysis['style_vector'])
         mock_vectors = []
         
         for i, artwork in enumerate(sample_artworks):
@@ -136,20 +137,20 @@ async def test_end_to_end():
     
     # Search for matching artwork
     print("\n🔍 Searching for similar artwork...")
-    style_vector = np.array(analysis['style_vector'])
+    style_vector = decode_style_vector(analysis['style_vector'])
     distances, matches = faiss_client.search(style_vector, k=3)
     
     print(f"\n✅ Found {len(matches)} recommendations:")
     recommendations = []
     
     for idx, (dist, artwork) in enumerate(zip(distances, matches), 1):
-        similarity = 1.0 / (1.0 + dist)
+        similarity = max(dist, 0.0)  # Cosine similarity from inner product index
         match_score = similarity * 100
         
         recommendations.append({
             **artwork,
             "match_score": match_score,
-            "similarity_distance": dist
+            "similarity": dist
         })
         
         print(f"\n   {idx}. {artwork['title']} by {artwork['artist']}")
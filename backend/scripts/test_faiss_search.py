@@ -17,6 +17,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from agents.vision_match_agent import VisionMatchAgent
 from db.faiss_client import FAISSClient
+from utils.vectors import decode_style_vector
 
 async def test_faiss_search():
     """Test FAISS search with real image embeddings"""
@@ -88,7 +89,7 @@ async def test_faiss_search():
                     "id": img_data['id'],
                     "name": img_data['name'],
                     "style": img_data['style'],
-                    "embedding": np.array(embedding),
+                    "embedding": decode_style_vector(embedding),
                     "metadata": {
                         "palette": analysis.get('palette', [])[:3],
                         "detected_style": analysis.get('style'),
@@ -141,11 +142,10 @@ async def test_faiss_search():
     
     print(f"\n   Top 3 similar rooms:")
     for idx, (dist, metadata) in enumerate(zip(distances, results), 1):
-        similarity = 1.0 / (1.0 + dist)  # Convert distance to similarity score
+        similarity = dist  # Inner product index returns cosine similarity
         print(f"\n      {idx}. {metadata.get('name', 'Unknown')}")
         print(f"         Style: {metadata.get('style', 'Unknown')}")
         print(f"         Similarity: {similarity:.2%}")
-        print(f"         Distance: {dist:.4f}")
         if 'palette' in metadata:
             colors = metadata['palette']
             if colors:
@@ -165,7 +165,7 @@ async def test_faiss_search():
         print(f"   Most similar:")
         for dist, metadata in zip(distances[:2], results[:2]):
             if metadata.get('name') != query_data['name']:
-                similarity = 1.0 / (1.0 + dist)
+                similarity = dist
                 print(f"      • {metadata.get('name')} ({metadata.get('style')})")
                 print(f"        Similarity: {similarity:.2%}")
     
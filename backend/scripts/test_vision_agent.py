@@ -16,6 +16,7 @@ import asyncio
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from agents.vision_match_agent import VisionMatchAgent
+from utils.vectors import decode_style_vector
 
 async def test_vision_agent():
     """Test VisionMatchAgent with various room images"""
@@ -106,9 +107,9 @@ async def test_vision_agent():
             print(f"         - Temperature: {temperature}")
             
             # Style vector
-            style_vector = analysis.get('style_vector', [])
+            style_vector = analysis.get('style_vector')
             if style_vector:
-                print(f"      Style Vector: {len(style_vector)} dimensions")
+                print(f"      Style Vector: {len(decode_style_vector(style_vector))} dimensions")
             
             print(f"   ✅ Test passed!")
             
@@ -176,7 +177,7 @@ async def test_with_dinov2():
         
         analysis = await agent.analyze_room(image, "Test room")
         
-        style_vector = analysis.get('style_vector', [])
+        style_vector = decode_style_vector(analysis.get('style_vector') or [])
         print(f"✅ DINOv2 test passed! Style vector: {len(style_vector)} dimensions")
         
     except Exception as e:
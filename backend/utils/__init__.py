@@ -3,5 +3,14 @@ Utility functions
 """
 
 from .file_storage import LocalFileStorage, get_file_storage
+from .vectors import encode_style_vector, decode_style_vector
+from .responses import MsgpackResponse, accepts_msgpack
 
-__all__ = ["LocalFileStorage", "get_file_storage"]
+__all__ = [
+    "LocalFileStorage",
+    "get_file_storage",
+    "encode_style_vector",
+    "decode_style_vector",
+    "MsgpackResponse",
+    "accepts_msgpack",
+]
@@ -0,0 +1,25 @@
+"""
+Binary response classes for clients that negotiate them via Accept
+"""
+
+from typing import Any
+
+import msgpack
+from fastapi import Request
+from fastapi.responses import Response
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+
+class MsgpackResponse(Response):
+    """MessagePack-encoded response (smaller and faster to encode than JSON)"""
+
+    media_type = MSGPACK_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        return msgpack.packb(content, use_bin_type=True)
+
+
+def accepts_msgpack(request: Request) -> bool:
+    """Whether the client asked for a MessagePack body"""
+    return MSGPACK_MEDIA_TYPE in request.headers.get("accept", "")
@@ -0,0 +1,43 @@
+"""
+Compact wire encoding for style embeddings
+
+Style vectors travel between /api/analyze_room, the frontend and
+/api/recommend as a base64 string of little-endian float16 values
+(1 KB for 512 dims instead of ~10 KB of JSON floats).
+"""
+
+import base64
+from typing import List, Union
+
+import numpy as np
+
+# Little-endian float16, independent of host byte order
+STYLE_VECTOR_DTYPE = np.dtype("<f2")
+
+# CLIP ViT-B/32 embedding size
+STYLE_VECTOR_DIM = 512
+
+
+def encode_style_vector(vector: np.ndarray) -> str:
+    """Encode an embedding as a base64 string of float16 values"""
+    return base64.b64encode(
+        np.asarray(vector, dtype=STYLE_VECTOR_DTYPE).tobytes()
+    ).decode("ascii")
+
+
+def decode_style_vector(
+    value: Union[str, bytes, List[float], np.ndarray]
+) -> np.ndarray:
+    """
+    Decode a style vector into a float32 numpy array
+
+    Accepts the base64 float16 encoding, a plain list of floats (legacy
+    clients), raw little-endian float32 bytes (viewed without copying) or
+    an existing array (converted only if it is not already float32).
+    """
+    if isinstance(value, str):
+        raw = np.frombuffer(base64.b64decode(value), dtype=STYLE_VECTOR_DTYPE)
+        return raw.astype(np.float32)
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return np.frombuffer(value, dtype="<f4")
+    return np.asarray(value, dtype=np.float32)
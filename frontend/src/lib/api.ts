@@ -37,7 +37,7 @@ export interface DetectedObject {
 export interface RoomAnalysisResponse {
   palette: ColorInfo[];
   lighting: LightingInfo | string; // Backend might return string or object
-  style_vector: number[];
+  style_vector: string | number[]; // base64 float16 (or legacy number[])
   detected_objects?: DetectedObject[];
   wall_spaces?: any[];
   style: string;
@@ -47,7 +47,7 @@ export interface RoomAnalysisResponse {
 }
 
 export interface RecommendationRequest {
-  style_vector: number[];
+  style_vector: string | number[]; // base64 float16 (or legacy number[])
   user_style?: string;
   room_type?: string;
   color_preferences?: string[];
@@ -272,7 +272,7 @@ export interface ChatRequest {
   image?: string; // Base64 encoded image
   context?: {
     style?: string;
-    style_vector?: number[];
+    style_vector?: string | number[];
     colors?: string[];
     preferences?: any;
   };